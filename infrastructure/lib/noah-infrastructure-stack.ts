@@ -116,10 +116,21 @@ export class NoahInfrastructureStack extends cdk.Stack {
     })
 
     // PostgreSQL Database for user profiles
+    const databaseEngine = rds.DatabaseInstanceEngine.postgres({
+      version: rds.PostgresEngineVersion.VER_15,
+    })
+
+    const databaseParameterGroup = new rds.ParameterGroup(this, 'NoahDatabaseParameters', {
+      engine: databaseEngine,
+      parameters: {
+        // lz4 decompresses large TOASTed content much faster than pglz
+        default_toast_compression: 'lz4',
+      },
+    })
+
     const database = new rds.DatabaseInstance(this, 'NoahDatabase', {
-      engine: rds.DatabaseInstanceEngine.postgres({
-        version: rds.PostgresEngineVersion.VER_15,
-      }),
+      engine: databaseEngine,
+      parameterGroup: databaseParameterGroup,
       instanceType: ec2.InstanceType.of(ec2.InstanceClass.T3, ec2.InstanceSize.MICRO),
       vpc,
       credentials: rds.Credentials.fromGeneratedSecret('noah_db_admin'),
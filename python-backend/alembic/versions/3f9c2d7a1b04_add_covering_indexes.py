@@ -0,0 +1,41 @@
+"""add_covering_indexes
+
+Revision ID: 3f9c2d7a1b04
+Revises: 6a1b012c8e7c
+Create Date: 2026-10-17 09:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2d7a1b04'
+down_revision: Union[str, Sequence[str], None] = '6a1b012c8e7c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Recent messages by session (ORDER BY timestamp DESC LIMIT N)
+    op.create_index(
+        'ix_msg_session_time_cov',
+        'conversation_messages',
+        ['session_id', 'timestamp'],
+        postgresql_include=['sender']
+    )
+    # Per-user reading behavior within a time window
+    op.create_index(
+        'ix_rb_user_start',
+        'reading_behaviors',
+        ['user_id', 'start_time'],
+        postgresql_include=['completion_rate', 'reading_speed']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_rb_user_start', table_name='reading_behaviors')
+    op.drop_index('ix_msg_session_time_cov', table_name='conversation_messages')
@@ -0,0 +1,174 @@
+"""partition_time_series_tables
+
+Revision ID: b71e4c0d9a53
+Revises: 3f9c2d7a1b04
+Create Date: 2026-10-17 10:41:07.218865
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71e4c0d9a53'
+down_revision: Union[str, Sequence[str], None] = '3f9c2d7a1b04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions are created from the oldest row up to this many
+# months ahead; anything outside that range lands in the default partition.
+MONTHS_AHEAD = 12
+
+# table -> (primary key column, partition key column, foreign keys, covering index)
+PARTITIONED_TABLES = {
+    'reading_behaviors': (
+        'id',
+        'start_time',
+        [
+            ('content_id', 'content_items', 'id'),
+            ('user_id', 'user_profiles', 'user_id'),
+        ],
+        ('ix_rb_user_start', ['user_id', 'start_time'],
+         ['completion_rate', 'reading_speed']),
+    ),
+    'conversation_messages': (
+        'message_id',
+        'timestamp',
+        [
+            ('session_id', 'conversation_sessions', 'session_id'),
+        ],
+        ('ix_msg_session_time_cov', ['session_id', 'timestamp'], ['sender']),
+    ),
+}
+
+
+def _add_months(month: date, count: int) -> date:
+    """Return the first day of the month ``count`` months after ``month``."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_monthly_partitions(table: str, first_month: date) -> None:
+    """Create monthly range partitions plus a default partition."""
+    today = datetime.utcnow().date().replace(day=1)
+    last_month = _add_months(today, MONTHS_AHEAD)
+
+    month = first_month
+    while month <= last_month:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_y{month.year}m{month.month:02d} "
+            f"PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # Declarative partitioning is PostgreSQL-only
+        return
+
+    # Range partition keys must be part of the primary key and non-null
+    op.execute(
+        "UPDATE conversation_messages SET timestamp = now() "
+        "WHERE timestamp IS NULL"
+    )
+
+    for table, (pk_column, key_column, foreign_keys, index) in PARTITIONED_TABLES.items():
+        legacy = f'{table}_legacy'
+        index_name, index_columns, include_columns = index
+
+        op.drop_index(index_name, table_name=table)
+        op.rename_table(table, legacy)
+        op.execute(
+            f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey"
+        )
+
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE ({key_column})"
+        )
+        op.alter_column(table, key_column, nullable=False)
+        if table == 'conversation_messages':
+            # Writers that omit the timestamp used to store NULL
+            op.alter_column(table, key_column, server_default=sa.func.now())
+        op.create_primary_key(f'{table}_pkey', table, [pk_column, key_column])
+        for column, referred_table, referred_column in foreign_keys:
+            op.create_foreign_key(
+                f'{table}_{column}_fkey', table, referred_table,
+                [column], [referred_column]
+            )
+
+        oldest = bind.execute(
+            sa.text(f"SELECT min({key_column}) FROM {legacy}")
+        ).scalar()
+        first_month = (oldest or datetime.utcnow()).date().replace(day=1)
+        _create_monthly_partitions(table, first_month)
+
+        # Indexes on the parent are created on every partition
+        op.create_index(
+            index_name, table, index_columns,
+            postgresql_include=include_columns
+        )
+
+        op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+
+    # Keep the serial sequence when the legacy table is dropped
+    op.execute(
+        "ALTER SEQUENCE reading_behaviors_id_seq OWNED BY reading_behaviors.id"
+    )
+    for table in PARTITIONED_TABLES:
+        op.drop_table(f'{table}_legacy')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    for table, (pk_column, key_column, foreign_keys, index) in PARTITIONED_TABLES.items():
+        partitioned = f'{table}_partitioned'
+        index_name, index_columns, include_columns = index
+
+        op.drop_index(index_name, table_name=table)
+        op.rename_table(table, partitioned)
+        op.execute(
+            f"ALTER TABLE {partitioned} RENAME CONSTRAINT {table}_pkey "
+            f"TO {partitioned}_pkey"
+        )
+
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {partitioned} INCLUDING DEFAULTS)"
+        )
+        if table == 'conversation_messages':
+            op.alter_column(
+                table, key_column, nullable=True, server_default=None
+            )
+        op.create_primary_key(f'{table}_pkey', table, [pk_column])
+        for column, referred_table, referred_column in foreign_keys:
+            op.create_foreign_key(
+                f'{table}_{column}_fkey', table, referred_table,
+                [column], [referred_column]
+            )
+        op.create_index(
+            index_name, table, index_columns,
+            postgresql_include=include_columns
+        )
+
+        op.execute(f"INSERT INTO {table} SELECT * FROM {partitioned}")
+
+    op.execute(
+        "ALTER SEQUENCE reading_behaviors_id_seq OWNED BY reading_behaviors.id"
+    )
+    for table in PARTITIONED_TABLES:
+        # Dropping the parent drops every partition
+        op.drop_table(f'{table}_partitioned')
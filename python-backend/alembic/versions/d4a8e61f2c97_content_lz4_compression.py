@@ -0,0 +1,55 @@
+"""content_lz4_compression
+
+Revision ID: d4a8e61f2c97
+Revises: b71e4c0d9a53
+Create Date: 2026-10-17 11:26:44.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8e61f2c97'
+down_revision: Union[str, Sequence[str], None] = 'b71e4c0d9a53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Large TOASTed columns that are read on every content fetch
+LZ4_COLUMNS = [
+    ('content_items', 'content'),
+    ('content_items', 'analysis'),
+]
+
+
+def _lz4_supported() -> bool:
+    """Check for PostgreSQL 14+ built with lz4 support."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return False
+
+    return bool(bind.execute(sa.text(
+        "SELECT count(*) FROM pg_settings "
+        "WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)"
+    )).scalar())
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _lz4_supported():
+        return
+
+    # Only newly written values use lz4; existing rows keep pglz until rewritten
+    for table, column in LZ4_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if not _lz4_supported():
+        return
+
+    for table, column in LZ4_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION default")
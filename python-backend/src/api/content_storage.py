@@ -3,12 +3,13 @@
 import logging
 from typing import List
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from sqlalchemy.orm import Session, undefer
 
 from src.database import get_db
 from src.services.content_storage import content_storage_service
 from src.services.database import db_service
+from src.services.response_cache import content_response_cache
 from src.schemas.content import (
     ContentIngestionRequest, ContentItemResponse, SavedContentRequest,
     SavedContentResponse, ContentSearchRequest, ContentSearchResponse,
@@ -176,16 +177,25 @@ async def get_content_by_id(
 
     Returns the full content item with metadata and analysis.
     """
+    cached = content_response_cache.get(content_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     try:
         with db_service.get_session() as session:
             from src.models.content import ContentItem
-            content_item = session.get(ContentItem, content_id)
+            content_item = session.get(
+                ContentItem, content_id,
+                options=[undefer(ContentItem.content)])
 
             if not content_item:
                 raise HTTPException(
                     status_code=404, detail=f"Content {content_id} not found")
 
-            return ContentItemResponse.from_orm(content_item)
+            payload = ContentItemResponse.model_validate(
+                content_item).model_dump_json(by_alias=True).encode()
+            content_response_cache.set(content_id, payload)
+            return Response(content=payload, media_type="application/json")
 
     except HTTPException:
         raise
@@ -1,7 +1,7 @@
 """Content management API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.orm import Session, undefer
 from typing import List, Optional, Dict
 from pydantic import BaseModel
 
@@ -13,6 +13,7 @@ from src.schemas.content import (
     ContentAnalysis
 )
 from src.services.content_service import content_service
+from src.services.response_cache import content_response_cache
 
 router = APIRouter()
 
@@ -103,13 +104,21 @@ async def get_content_item(
     db: Session = Depends(get_db)
 ):
     """Get content item by ID."""
-    content = db.query(ContentItem).filter(
-        ContentItem.id == content_id).first()
+    cached = content_response_cache.get(content_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    content = db.query(ContentItem).options(
+        undefer(ContentItem.content)
+    ).filter(ContentItem.id == content_id).first()
 
     if not content:
         raise HTTPException(status_code=404, detail="Content item not found")
 
-    return content
+    payload = ContentItemResponse.model_validate(
+        content).model_dump_json(by_alias=True).encode()
+    content_response_cache.set(content_id, payload)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/", response_model=List[ContentItemResponse])
@@ -120,7 +129,7 @@ async def list_content_items(
     db: Session = Depends(get_db)
 ):
     """List content items with optional filtering."""
-    query = db.query(ContentItem)
+    query = db.query(ContentItem).options(undefer(ContentItem.content))
 
     if language:
         query = query.filter(ContentItem.language == language)
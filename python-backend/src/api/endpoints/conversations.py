@@ -1,7 +1,7 @@
 """Conversation API endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from typing import List
 import uuid
 from datetime import datetime
@@ -185,7 +185,10 @@ async def get_session_messages(
     db: Session = Depends(get_db)
 ):
     """Get messages for a conversation session."""
-    messages = db.query(ConversationMessage).filter(
+    messages = db.query(ConversationMessage).options(
+        undefer(ConversationMessage.content),
+        undefer(ConversationMessage.recommendations)
+    ).filter(
         ConversationMessage.session_id == session_id
     ).order_by(ConversationMessage.timestamp.desc()).offset(offset).limit(limit).all()
 
@@ -1,12 +1,13 @@
 """User profile API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from typing import List
 
 from src.database import get_db
 from src.models.user_profile import UserProfile
 from src.schemas.user_profile import UserProfileCreate, UserProfileResponse
+from src.services.response_cache import user_profile_response_cache
 
 router = APIRouter()
 
@@ -47,12 +48,18 @@ async def get_user_profile(
     db: Session = Depends(get_db)
 ):
     """Get user profile by ID."""
+    cached = user_profile_response_cache.get(user_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     user = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
 
     if not user:
         raise HTTPException(status_code=404, detail="User profile not found")
 
-    return user
+    payload = UserProfileResponse.model_validate(user).model_dump_json().encode()
+    user_profile_response_cache.set(user_id, payload)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.put("/{user_id}", response_model=UserProfileResponse)
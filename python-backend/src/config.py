@@ -39,6 +39,12 @@ class Settings(BaseSettings):
 
     # OpenAI API
     openai_api_key: str = ""
+    openai_max_concurrency: int = 8  # Concurrent OpenAI requests per process
+    simulate_streaming_delay: float = 0.0  # Per-chunk delay for fallback streaming
+    semantic_cache_enabled: bool = True
+    semantic_cache_threshold: float = 0.92  # Cosine similarity needed for a cache hit
+    openai_max_input_tokens: int = 3000  # Budget for system prompt, history and user prompt
+    embedding_cache_path: str = ""  # SQLite file for persisted embeddings; empty disables
 
     # Strands Agents Configuration
     strands_enabled: bool = True
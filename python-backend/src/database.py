@@ -1,8 +1,7 @@
 """Database configuration and session management."""
 
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
 from typing import Generator
 
 from src.config import settings
@@ -19,8 +18,9 @@ engine = create_engine(
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create Base class for models
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base class for models."""
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -6,7 +6,7 @@ from typing import Optional
 
 from src.database import get_db
 from src.services.database import db_service
-from src.services.agent_core import AgentCoreService
+from src.services.agent_core import agent_core_service
 from src.models.user_profile import UserProfile
 
 
@@ -17,7 +17,7 @@ def get_database_service():
 
 def get_agent_core_service():
     """Dependency to get AWS Agent Core service."""
-    return AgentCoreService()
+    return agent_core_service
 
 
 async def get_user_profile(
@@ -216,6 +216,14 @@ def create_app() -> FastAPI:
     async def shutdown_event():
         """Clean up resources on shutdown."""
         logger.info("Shutting down Noah Reading Agent...")
+
+        from src.services.agent_core import agent_core_service
+        from src.services.ai_response_service import ai_response_service
+        from src.services.auth_service import auth_service
+        await agent_core_service.close()
+        await ai_response_service.aclose()
+        await auth_service.aclose()
+
         logger.info("Noah Reading Agent shutdown completed")
 
     return app
@@ -1,33 +1,43 @@
 """Content and recommendation models."""
 
-from sqlalchemy import Column, String, DateTime, Integer, Float, JSON, Text, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, DateTime, Integer, Float, JSON, Text, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
+from typing import Any, List, Optional, TYPE_CHECKING
 
 from src.database import Base
 
+if TYPE_CHECKING:
+    from .user_profile import ReadingBehavior, UserProfile
+
 
 class ContentItem(Base):
     """Content item model for books and articles."""
 
     __tablename__ = "content_items"
 
-    id = Column(String, primary_key=True)
-    title = Column(String, nullable=False)
-    content = Column(Text, nullable=False)
-    language = Column(String, nullable=False)  # "english" or "japanese"
-    content_metadata = Column(JSON)  # ContentMetadata as JSON
-    analysis = Column(JSON)  # ContentAnalysis as JSON
-    adaptations = Column(JSON)  # List of ContentAdaptation as JSON
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow,
-                        onupdate=datetime.utcnow)
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    # Deferred: article text dominates row size; undefer() where it's needed
+    content: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
+    language: Mapped[str] = mapped_column(
+        String, nullable=False)  # "english" or "japanese"
+    content_metadata: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # ContentMetadata as JSON
+    analysis: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # ContentAnalysis as JSON
+    adaptations: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # List of ContentAdaptation as JSON
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    reading_behaviors = relationship(
-        "ReadingBehavior", back_populates="content_item")
-    discovery_recommendations = relationship(
-        "DiscoveryRecommendation", back_populates="content_item")
+    reading_behaviors: Mapped[List["ReadingBehavior"]] = relationship(
+        back_populates="content_item")
+    discovery_recommendations: Mapped[List["DiscoveryRecommendation"]] = relationship(
+        back_populates="content_item")
 
 
 class DiscoveryRecommendation(Base):
@@ -35,19 +45,24 @@ class DiscoveryRecommendation(Base):
 
     __tablename__ = "discovery_recommendations"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    content_id = Column(String, ForeignKey("content_items.id"))
-    user_id = Column(String, ForeignKey("user_profiles.user_id"))
-    divergence_score = Column(Float, nullable=False)
-    bridging_topics = Column(JSON)  # List of topics
-    discovery_reason = Column(String, nullable=False)
+    id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=True)
+    content_id: Mapped[Optional[str]] = mapped_column(
+        String, ForeignKey("content_items.id"))
+    user_id: Mapped[Optional[str]] = mapped_column(
+        String, ForeignKey("user_profiles.user_id"))
+    divergence_score: Mapped[float] = mapped_column(Float, nullable=False)
+    bridging_topics: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # List of topics
+    discovery_reason: Mapped[str] = mapped_column(String, nullable=False)
     # "interested", "not_interested", "purchased", "saved"
-    user_response = Column(String)
-    response_timestamp = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    user_response: Mapped[Optional[str]] = mapped_column(String)
+    response_timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow)
 
     # Relationships
-    content_item = relationship(
-        "ContentItem", back_populates="discovery_recommendations")
-    user_profile = relationship(
-        "UserProfile", back_populates="discovery_recommendations")
+    content_item: Mapped[Optional["ContentItem"]] = relationship(
+        back_populates="discovery_recommendations")
+    user_profile: Mapped[Optional["UserProfile"]] = relationship(
+        back_populates="discovery_recommendations")
@@ -1,45 +1,72 @@
 """Conversation and messaging models."""
 
-from sqlalchemy import Column, String, DateTime, Integer, JSON, Text, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, DateTime, Integer, JSON, Text, ForeignKey, Boolean, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
+from typing import Any, List, Optional, TYPE_CHECKING
 
 from src.database import Base
 
+if TYPE_CHECKING:
+    from .user_profile import UserProfile
+
 
 class ConversationSession(Base):
     """Conversation session model."""
 
     __tablename__ = "conversation_sessions"
 
-    session_id = Column(String, primary_key=True)
-    user_id = Column(String, ForeignKey("user_profiles.user_id"))
-    context = Column(JSON)  # ConversationContext as JSON
-    start_time = Column(DateTime, default=datetime.utcnow)
-    last_activity = Column(DateTime, default=datetime.utcnow)
-    is_persistent = Column(Boolean, default=True)
+    session_id: Mapped[str] = mapped_column(String, primary_key=True)
+    user_id: Mapped[Optional[str]] = mapped_column(
+        String, ForeignKey("user_profiles.user_id"))
+    context: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # ConversationContext as JSON
+    start_time: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow)
+    last_activity: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow)
+    is_persistent: Mapped[Optional[bool]] = mapped_column(
+        Boolean, default=True)
 
     # Relationships
-    messages = relationship("ConversationMessage", back_populates="session")
-    user_profile = relationship(
-        "UserProfile", back_populates="conversation_sessions")
+    messages: Mapped[List["ConversationMessage"]] = relationship(
+        back_populates="session")
+    user_profile: Mapped[Optional["UserProfile"]] = relationship(
+        back_populates="conversation_sessions")
 
 
 class ConversationMessage(Base):
-    """Individual conversation message model."""
+    """Individual conversation message model.
 
-    __tablename__ = "conversation_messages"
+    On PostgreSQL the table is range-partitioned by month on ``timestamp``
+    (see the ``partition_time_series_tables`` migration).
+    """
 
-    message_id = Column(String, primary_key=True)
-    session_id = Column(String, ForeignKey("conversation_sessions.session_id"))
-    sender = Column(String, nullable=False)  # "user" or "noah"
-    content = Column(Text, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow)
-    intent = Column(JSON)  # UserIntent as JSON
-    recommendations = Column(JSON)  # List of ContentRecommendation
+    __tablename__ = "conversation_messages"
+    __table_args__ = (
+        # Covering index for "recent messages by session". ``content`` is
+        # left out of INCLUDE: long replies would exceed the btree row limit.
+        Index(
+            "ix_msg_session_time_cov", "session_id", "timestamp",
+            postgresql_include=["sender"]),
+    )
+
+    message_id: Mapped[str] = mapped_column(String, primary_key=True)
+    session_id: Mapped[Optional[str]] = mapped_column(
+        String, ForeignKey("conversation_sessions.session_id"))
+    sender: Mapped[str] = mapped_column(
+        String, nullable=False)  # "user" or "noah"
+    # Deferred: loaded on access or via undefer() on queries that need it
+    content: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False)
+    intent: Mapped[Optional[Any]] = mapped_column(JSON)  # UserIntent as JSON
+    recommendations: Mapped[Optional[Any]] = mapped_column(
+        JSON, deferred=True)  # List of ContentRecommendation
 
     # Relationships
-    session = relationship("ConversationSession", back_populates="messages")
+    session: Mapped[Optional["ConversationSession"]] = relationship(
+        back_populates="messages")
 
 
 class ConversationHistory(Base):
@@ -47,8 +74,9 @@ class ConversationHistory(Base):
 
     __tablename__ = "conversation_histories"
 
-    user_id = Column(String, primary_key=True)
-    total_messages = Column(Integer, default=0)
-    first_interaction = Column(DateTime)
-    last_interaction = Column(DateTime)
-    conversation_summaries = Column(JSON)  # List of ConversationSummary
+    user_id: Mapped[str] = mapped_column(String, primary_key=True)
+    total_messages: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    first_interaction: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    last_interaction: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    conversation_summaries: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # List of ConversationSummary
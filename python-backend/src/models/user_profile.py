@@ -1,57 +1,83 @@
 """User profile and behavior models."""
 
-from sqlalchemy import Column, String, DateTime, Integer, Float, JSON, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import String, DateTime, Integer, Float, JSON, ForeignKey, Boolean, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
+from typing import Any, List, Optional, TYPE_CHECKING
 
 from src.database import Base
 
+if TYPE_CHECKING:
+    from .content import ContentItem, DiscoveryRecommendation
+    from .conversation import ConversationSession
+
 
 class UserProfile(Base):
     """User profile model storing preferences and reading levels."""
 
     __tablename__ = "user_profiles"
 
-    user_id = Column(String, primary_key=True)
-    preferences = Column(JSON)  # PreferenceModel as JSON
-    reading_levels = Column(JSON)  # LanguageReadingLevels as JSON
-    last_updated = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    user_id: Mapped[str] = mapped_column(String, primary_key=True)
+    preferences: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # PreferenceModel as JSON
+    reading_levels: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # LanguageReadingLevels as JSON
+    last_updated: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow)
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow)
 
     # Relationships
-    behavior_history = relationship(
-        "ReadingBehavior", back_populates="user_profile")
-    preference_snapshots = relationship(
-        "PreferenceSnapshot", back_populates="user_profile")
-    conversation_sessions = relationship(
-        "ConversationSession", back_populates="user_profile")
-    discovery_recommendations = relationship(
-        "DiscoveryRecommendation", back_populates="user_profile")
+    behavior_history: Mapped[List["ReadingBehavior"]] = relationship(
+        back_populates="user_profile")
+    preference_snapshots: Mapped[List["PreferenceSnapshot"]] = relationship(
+        back_populates="user_profile")
+    conversation_sessions: Mapped[List["ConversationSession"]] = relationship(
+        back_populates="user_profile")
+    discovery_recommendations: Mapped[List["DiscoveryRecommendation"]] = relationship(
+        back_populates="user_profile")
 
 
 class ReadingBehavior(Base):
-    """Reading behavior tracking model."""
+    """Reading behavior tracking model.
 
-    __tablename__ = "reading_behaviors"
+    On PostgreSQL the table is range-partitioned by month on ``start_time``
+    (see the ``partition_time_series_tables`` migration).
+    """
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    content_id = Column(String, ForeignKey("content_items.id"))
-    user_id = Column(String, ForeignKey("user_profiles.user_id"))
-    session_id = Column(String, nullable=False)
-    start_time = Column(DateTime, nullable=False)
-    end_time = Column(DateTime)
-    completion_rate = Column(Float)
-    reading_speed = Column(Float)
-    pause_patterns = Column(JSON)  # List of pause events
-    interactions = Column(JSON)  # List of interaction events
-    context = Column(JSON)  # ReadingContext as JSON
-    created_at = Column(DateTime, default=datetime.utcnow)
+    __tablename__ = "reading_behaviors"
+    __table_args__ = (
+        # Covering index for per-user behavior lookups within a time window.
+        Index(
+            "ix_rb_user_start", "user_id", "start_time",
+            postgresql_include=["completion_rate", "reading_speed"]),
+    )
+
+    id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=True)
+    content_id: Mapped[Optional[str]] = mapped_column(
+        String, ForeignKey("content_items.id"))
+    user_id: Mapped[Optional[str]] = mapped_column(
+        String, ForeignKey("user_profiles.user_id"))
+    session_id: Mapped[str] = mapped_column(String, nullable=False)
+    start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    end_time: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    completion_rate: Mapped[Optional[float]] = mapped_column(Float)
+    reading_speed: Mapped[Optional[float]] = mapped_column(Float)
+    pause_patterns: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # List of pause events
+    interactions: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # List of interaction events
+    context: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # ReadingContext as JSON
+    created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow)
 
     # Relationships
-    user_profile = relationship(
-        "UserProfile", back_populates="behavior_history")
-    content_item = relationship(
-        "ContentItem", back_populates="reading_behaviors")
+    user_profile: Mapped[Optional["UserProfile"]] = relationship(
+        back_populates="behavior_history")
+    content_item: Mapped[Optional["ContentItem"]] = relationship(
+        back_populates="reading_behaviors")
 
 
 class PreferenceSnapshot(Base):
@@ -59,14 +85,19 @@ class PreferenceSnapshot(Base):
 
     __tablename__ = "preference_snapshots"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String, ForeignKey("user_profiles.user_id"))
-    timestamp = Column(DateTime, default=datetime.utcnow)
-    topic_weights = Column(JSON)  # Dict mapping topics to weights
-    reading_level_preference = Column(Float)
-    contextual_factors = Column(JSON)  # Dict of contextual factors
-    confidence_score = Column(Float)
+    id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[Optional[str]] = mapped_column(
+        String, ForeignKey("user_profiles.user_id"))
+    timestamp: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, default=datetime.utcnow)
+    topic_weights: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # Dict mapping topics to weights
+    reading_level_preference: Mapped[Optional[float]] = mapped_column(Float)
+    contextual_factors: Mapped[Optional[Any]] = mapped_column(
+        JSON)  # Dict of contextual factors
+    confidence_score: Mapped[Optional[float]] = mapped_column(Float)
 
     # Relationships
-    user_profile = relationship(
-        "UserProfile", back_populates="preference_snapshots")
+    user_profile: Mapped[Optional["UserProfile"]] = relationship(
+        back_populates="preference_snapshots")
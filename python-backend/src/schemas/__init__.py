@@ -12,7 +12,15 @@ from .content import (
     ContentItemCreate,
     ContentItemResponse,
     ContentMetadata,
-    ContentAnalysis
+    ContentAnalysis,
+    SavedContentRequest,
+    SavedContentResponse,
+    ContentSearchRequest,
+    ContentSearchResult,
+    ContentSearchResponse,
+    ContentRecommendationRequest,
+    ContentIngestionRequest,
+    SearchResultsAdapter
 )
 from .conversation import (
     ConversationSessionCreate,
@@ -36,6 +44,14 @@ __all__ = [
     "ContentItemResponse",
     "ContentMetadata",
     "ContentAnalysis",
+    "SavedContentRequest",
+    "SavedContentResponse",
+    "ContentSearchRequest",
+    "ContentSearchResult",
+    "ContentSearchResponse",
+    "ContentRecommendationRequest",
+    "ContentIngestionRequest",
+    "SearchResultsAdapter",
 
     # Conversation schemas
     "ConversationSessionCreate",
@@ -1,8 +1,9 @@
 """Pydantic schemas for content data."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
 from typing import List, Dict, Optional
+import numpy as np
 
 
 class ContentMetadata(BaseModel):
@@ -31,6 +32,10 @@ class ContentAnalysis(BaseModel):
     embedding: List[float]
     key_phrases: List[str]
 
+    def to_numpy(self) -> np.ndarray:
+        """Return the embedding as a float32 vector for batched math."""
+        return np.asarray(self.embedding, dtype=np.float32)
+
 
 class ContentItemCreate(BaseModel):
     """Schema for creating content items."""
@@ -127,3 +132,7 @@ class ContentIngestionRequest(BaseModel):
     content_type: Optional[str] = "article"
     tags: Optional[List[str]] = []
     user_id: Optional[str] = None
+
+
+# Module-level adapter so search results are validated in a single pass
+SearchResultsAdapter = TypeAdapter(List[ContentSearchResult])
@@ -1,15 +1,124 @@
 """AWS Agent Core integration service."""
 
-import boto3
+import asyncio
 import httpx
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import orjson
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime, timezone
 
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Fallback intent triggers in priority order (purchase is the most specific)
+_FALLBACK_INTENT_TRIGGERS = (
+    ("purchase_inquiry", 0.7, ("buy", "purchase", "get", "order", "where can i")),
+    ("discovery_mode", 0.7, ("surprise", "lucky", "discover", "new")),
+    ("book_recommendation", 0.7, ("recommend", "suggest", "book", "read")),
+    ("feedback", 0.6, ("interested", "not for me", "like", "dislike")),
+)
+
+# trigger -> (priority, intent, confidence), matched as substrings in one pass;
+# the lookahead lets overlapping triggers all match, like repeated `in` checks
+_TRIGGER_INTENTS = {
+    trigger: (priority, intent, confidence)
+    for priority, (intent, confidence, triggers) in enumerate(_FALLBACK_INTENT_TRIGGERS)
+    for trigger in triggers
+}
+_TRIGGER_RE = re.compile(
+    r"(?=(" + "|".join(
+        re.escape(trigger) for trigger in sorted(_TRIGGER_INTENTS, key=len, reverse=True)
+    ) + r"))"
+)
+
+_FALLBACK_RESPONSES = {
+    "book_recommendation": "I'd be happy to recommend some books for you! What genres or topics interest you?",
+    "discovery_mode": "Let's explore something new! I'll find some books outside your usual preferences.",
+    "general_conversation": "I'm Noah, your reading companion. How can I help you discover your next great read?"
+}
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as a second-precision ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@lru_cache(maxsize=1024)
+def _classify_fallback_intent(message_lower: str) -> Tuple[str, float]:
+    """Classify a lowercased message into an (intent, confidence) pair."""
+    best = None
+    for match in _TRIGGER_RE.finditer(message_lower):
+        candidate = _TRIGGER_INTENTS[match.group(1)]
+        if best is None or candidate < best:
+            best = candidate
+            if best[0] == 0:
+                break
+
+    if best is None:
+        return "general_conversation", 0.5
+    return best[1], best[2]
+
+
+@lru_cache(maxsize=1024)
+def _detect_fallback_languages(message_lower: str) -> Tuple[str, ...]:
+    """Return the languages mentioned in a lowercased message."""
+    return tuple(
+        language for language in ("japanese", "english")
+        if language in message_lower
+    )
+
+
+class CircuitOpenError(Exception):
+    """Raised when Agent Core calls are short-circuited by the breaker."""
+
+
+@dataclass
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for the Agent Core endpoint."""
+    fail_threshold: int = 5
+    reset_seconds: float = 30.0
+    failure_count: int = 0
+    opened_at: Optional[float] = None
+    probing: bool = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls should skip the endpoint."""
+        return self.opened_at is not None and (
+            self.probing
+            or time.monotonic() - self.opened_at < self.reset_seconds
+        )
+
+    def allow_request(self) -> bool:
+        """Whether a call may go to the endpoint.
+
+        Once the cooldown elapses a single call is let through as the probe
+        (half-open); the rest keep skipping the endpoint until it reports.
+        """
+        if self.is_open:
+            return False
+        if self.opened_at is not None:
+            self.probing = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failure_count = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self) -> None:
+        """Count a failure, (re)opening the breaker at the threshold."""
+        self.failure_count += 1
+        self.probing = False
+        if self.failure_count >= self.fail_threshold:
+            self.opened_at = time.monotonic()
+
 
 class AgentCoreService:
     """Service for integrating with AWS Agent Core."""
@@ -18,12 +127,27 @@ class AgentCoreService:
         """Initialize AWS Agent Core service."""
         self.endpoint = settings.agent_core_endpoint
         self.api_key = settings.agent_core_api_key
-        self.session = boto3.Session(
-            aws_access_key_id=settings.aws_access_key_id,
-            aws_secret_access_key=settings.aws_secret_access_key,
-            region_name=settings.aws_region
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+        # One pooled client per service so repeated calls to the Agent Core
+        # endpoint reuse keep-alive connections instead of re-handshaking
+        self._client = httpx.AsyncClient(
+            base_url=self.endpoint,
+            headers=self._headers,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=httpx.Timeout(10.0)
         )
-        
+
+        self._breaker = CircuitBreaker(fail_threshold=5, reset_seconds=30)
+
+        # Fire-and-forget context updates, drained by a single worker task
+        # started on first use so construction doesn't need a running loop
+        self._ctx_queue: Optional[asyncio.Queue] = None
+        self._ctx_worker: Optional[asyncio.Task] = None
+
         # Initialize enhanced intent service
         try:
             from src.services.enhanced_intent_service import EnhancedIntentService
@@ -32,6 +156,75 @@ class AgentCoreService:
             logger.warning(f"Failed to initialize enhanced intent service: {e}")
             self.enhanced_intent_service = None
 
+    async def close(self) -> None:
+        """Flush pending context updates and close the underlying HTTP client."""
+        if self._ctx_worker is not None:
+            await self._ctx_queue.join()
+            self._ctx_worker.cancel()
+            try:
+                await self._ctx_worker
+            except asyncio.CancelledError:
+                pass
+            self._ctx_worker = None
+            self._ctx_queue = None
+
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AgentCoreService":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the HTTP client on exit."""
+        await self.close()
+
+    async def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a JSON payload to Agent Core, honouring the circuit breaker."""
+        if not self._breaker.allow_request():
+            raise CircuitOpenError(f"Agent Core circuit open, skipping {path}")
+
+        try:
+            response = await self._client.post(path, content=orjson.dumps(payload))
+        except httpx.TransportError:
+            self._breaker.record_failure()
+            raise
+        except BaseException:
+            # An interrupted probe says nothing about the endpoint
+            self._breaker.probing = False
+            raise
+
+        # Only server errors count against the endpoint; a 4xx is a bad
+        # request from this caller and shows the endpoint is reachable
+        if response.is_server_error:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def analyze(
+        self,
+        message: str,
+        context: Optional[Dict] = None,
+        metadata: Optional[Dict] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, List[str]]]:
+        """Analyze intent and extract entities for a message concurrently."""
+        intent, entities = await asyncio.gather(
+            self.analyze_intent(message, context, metadata),
+            self.extract_entities(message),
+            return_exceptions=True
+        )
+
+        # A failure in one lookup shouldn't discard the other's result
+        if isinstance(intent, Exception):
+            logger.warning(f"Intent analysis failed: {intent}")
+            intent = self._fallback_intent_analysis(message, metadata)
+        if isinstance(entities, Exception):
+            logger.warning(f"Entity extraction failed: {entities}")
+            entities = self._fallback_entity_extraction(message)
+
+        return intent, entities
+
     async def analyze_intent(self, message: str, context: Optional[Dict] = None, metadata: Optional[Dict] = None) -> Dict[str, Any]:
         """Analyze user message intent using enhanced AI or AWS Agent Core."""
         try:
@@ -45,22 +238,12 @@ class AgentCoreService:
                 )
             
             # Fallback to AWS Agent Core
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.endpoint}/analyze-intent",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "message": message,
-                        "context": context or {},
-                        "metadata": metadata or {},
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._post("/analyze-intent", {
+                "message": message,
+                "context": context or {},
+                "metadata": metadata or {},
+                "timestamp": _now_iso()
+            })
         except Exception as e:
             # Final fallback to basic intent analysis
             return self._fallback_intent_analysis(message, metadata)
@@ -76,20 +259,10 @@ class AgentCoreService:
                 )
             
             # Fallback to AWS Agent Core
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.endpoint}/extract-entities",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "message": message,
-                        "entity_types": ["book_title", "author", "genre", "language", "reading_preferences", "feedback_indicators"]
-                    }
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._post("/extract-entities", {
+                "message": message,
+                "entity_types": ["book_title", "author", "genre", "language", "reading_preferences", "feedback_indicators"]
+            })
         except Exception as e:
             # Final fallback to basic entity extraction
             return self._fallback_entity_extraction(message)
@@ -103,29 +276,19 @@ class AgentCoreService:
     ) -> str:
         """Generate conversational response using AWS Agent Core or AI fallback."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.endpoint}/generate-response",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "user_message": user_message,
-                        "intent": intent,
-                        "context": context,
-                        "recommendations": recommendations or [],
-                        "persona": "noah_reading_agent"
-                    }
-                )
-                response.raise_for_status()
-                return response.json().get("response", "I'm here to help with your reading!")
+            result = await self._post("/generate-response", {
+                "user_message": user_message,
+                "intent": intent,
+                "context": context,
+                "recommendations": recommendations or [],
+                "persona": "noah_reading_agent"
+            })
+            return result.get("response", "I'm here to help with your reading!")
         except Exception as e:
             # Enhanced fallback using AI response service if available
             try:
-                from src.services.ai_response_service import AIResponseService
-                ai_service = AIResponseService()
-                return await ai_service.generate_response(
+                from src.services.ai_response_service import ai_response_service
+                return await ai_response_service.generate_response(
                     user_message=user_message,
                     intent=intent,
                     context=context,
@@ -136,6 +299,36 @@ class AgentCoreService:
                 # Final fallback to basic response generation
                 return self._fallback_response_generation(user_message, intent)
 
+    def enqueue_context_update(
+        self,
+        session_id: str,
+        user_message: str,
+        agent_response: str,
+        intent: Dict
+    ) -> None:
+        """Schedule a context update without waiting for Agent Core."""
+        if self._ctx_worker is None or self._ctx_worker.done():
+            self._ctx_queue = asyncio.Queue(maxsize=1024)
+            self._ctx_worker = asyncio.create_task(self._drain_context_queue())
+
+        try:
+            self._ctx_queue.put_nowait((session_id, user_message, agent_response, intent))
+        except asyncio.QueueFull:
+            logger.warning(f"Context update queue full, dropping update for {session_id}")
+
+    async def _drain_context_queue(self) -> None:
+        """Send queued context updates to Agent Core one at a time."""
+        while True:
+            session_id, user_message, agent_response, intent = await self._ctx_queue.get()
+            try:
+                await self.update_conversation_context(
+                    session_id, user_message, agent_response, intent
+                )
+            except Exception as e:
+                logger.error(f"Background context update failed: {e}")
+            finally:
+                self._ctx_queue.task_done()
+
     async def update_conversation_context(
         self,
         session_id: str,
@@ -145,30 +338,20 @@ class AgentCoreService:
     ) -> Dict:
         """Update conversation context using AWS Agent Core."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.endpoint}/update-context",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "session_id": session_id,
-                        "user_message": user_message,
-                        "agent_response": agent_response,
-                        "intent": intent,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                )
-                response.raise_for_status()
-                return response.json()
+            return await self._post("/update-context", {
+                "session_id": session_id,
+                "user_message": user_message,
+                "agent_response": agent_response,
+                "intent": intent,
+                "timestamp": _now_iso()
+            })
         except Exception as e:
             # Fallback context update
             return {
                 "session_id": session_id,
                 "updated_context": {
                     "last_intent": intent.get("intent", "unknown"),
-                    "last_update": datetime.utcnow().isoformat()
+                    "last_update": _now_iso()
                 }
             }
 
@@ -204,37 +387,12 @@ class AgentCoreService:
                     }
                 }
 
-        # Check for purchase intent first (more specific)
-        if any(word in message_lower for word in ["buy", "purchase", "get", "order", "where can i"]):
-            return {
-                "intent": "purchase_inquiry",
-                "confidence": 0.7,
-                "entities": {}
-            }
-        elif any(word in message_lower for word in ["surprise", "lucky", "discover", "new"]):
-            return {
-                "intent": "discovery_mode",
-                "confidence": 0.7,
-                "entities": {}
-            }
-        elif any(word in message_lower for word in ["recommend", "suggest", "book", "read"]):
-            return {
-                "intent": "book_recommendation",
-                "confidence": 0.7,
-                "entities": {}
-            }
-        elif any(word in message_lower for word in ["interested", "not for me", "like", "dislike"]):
-            return {
-                "intent": "feedback",
-                "confidence": 0.6,
-                "entities": {}
-            }
-        else:
-            return {
-                "intent": "general_conversation",
-                "confidence": 0.5,
-                "entities": {}
-            }
+        intent, confidence = _classify_fallback_intent(message_lower)
+        return {
+            "intent": intent,
+            "confidence": confidence,
+            "entities": {}
+        }
 
     def _fallback_entity_extraction(self, message: str) -> Dict[str, List[str]]:
         """Fallback entity extraction."""
@@ -247,21 +405,15 @@ class AgentCoreService:
         }
 
         # Simple pattern matching (to be enhanced)
-        if "japanese" in message.lower():
-            entities["language"].append("japanese")
-        if "english" in message.lower():
-            entities["language"].append("english")
+        entities["language"].extend(_detect_fallback_languages(message.lower()))
 
         return entities
 
     def _fallback_response_generation(self, user_message: str, intent: Dict) -> str:
         """Fallback response generation."""
         intent_type = intent.get("intent", "general_conversation")
+        return _FALLBACK_RESPONSES.get(intent_type, _FALLBACK_RESPONSES["general_conversation"])
 
-        responses = {
-            "book_recommendation": "I'd be happy to recommend some books for you! What genres or topics interest you?",
-            "discovery_mode": "Let's explore something new! I'll find some books outside your usual preferences.",
-            "general_conversation": "I'm Noah, your reading companion. How can I help you discover your next great read?"
-        }
 
-        return responses.get(intent_type, responses["general_conversation"])
+# Global service instance
+agent_core_service = AgentCoreService()
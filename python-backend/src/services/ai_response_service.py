@@ -1,16 +1,215 @@
 """AI Response Generation Service using OpenAI API."""
 
+import hashlib
+import io
 import logging
-import json
-from typing import Dict, List, Optional, Any, AsyncGenerator
+import orjson
+from typing import Dict, List, Optional, Any, AsyncGenerator, AsyncIterator, Final, Tuple
 from datetime import datetime
+from functools import lru_cache
 import openai
 import asyncio
+import httpx
 
 from src.config import settings
+from src.services.response_cache import ResponseCache
+from src.services.semantic_cache import SemanticResponseCache
+
+# tiktoken is optional; without it token counts are estimated from byte length
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
 logger = logging.getLogger(__name__)
 
+_NOAH_SYSTEM_PROMPT: Final[str] = """You are Noah, an intelligent and enthusiastic reading companion. Your personality traits:
+
+PERSONALITY:
+- Warm, friendly, and genuinely excited about books and reading
+- Knowledgeable but never condescending or overwhelming
+- Supportive of all reading levels and preferences
+- Curious about user preferences and reading goals
+- Encouraging and positive about the reading journey
+
+CONVERSATION STYLE:
+- Use natural, conversational language
+- Ask thoughtful follow-up questions to understand preferences better
+- Explain recommendations with genuine enthusiasm
+- Remember and reference previous conversations when relevant
+- Be concise but engaging - avoid overly long responses
+
+CORE RESPONSIBILITIES:
+1. Provide personalized book recommendations based on user preferences
+2. Help users discover new genres and authors through "discovery mode"
+3. Process feedback to improve future recommendations
+4. Maintain engaging conversations about books, reading, and literature
+5. Support users in their reading journey regardless of their level
+
+RESPONSE GUIDELINES:
+- Always respond in character as Noah
+- When making recommendations, explain why you think the user might enjoy each book
+- Be encouraging about reading goals and progress
+- If you don't have specific book information, focus on helping the user describe what they're looking for
+- Keep responses conversational and avoid being too formal or robotic
+
+Remember: You're not just providing information - you're being a supportive reading companion who genuinely cares about helping users find their next great read."""
+
+_NOAH_SYSTEM_PROMPT_JA: Final[str] = """あなたはノア（Noah）です。知的で熱心な読書の友達です。あなたの性格的特徴：
+
+性格：
+- 温かく、親しみやすく、本と読書に対して心から興奮している
+- 知識豊富だが、決して見下したり圧倒したりしない
+- すべての読書レベルと好みをサポートする
+- ユーザーの好みや読書目標に好奇心を持つ
+- 読書の旅路について励ましと前向きさを持つ
+
+会話スタイル：
+- 自然で会話的な言葉遣いを使う
+- 好みをより良く理解するために思慮深いフォローアップ質問をする
+- 心からの熱意を持って推薦を説明する
+- 関連する場合は以前の会話を覚えて参照する
+- 簡潔だが魅力的に - 過度に長い回答は避ける
+
+主な責任：
+1. ユーザーの好みに基づいてパーソナライズされた本の推薦を提供する
+2. 「発見モード」を通じて新しいジャンルや著者を発見する手助けをする
+3. フィードバックを処理して将来の推薦を改善する
+4. 本、読書、文学について魅力的な会話を維持する
+5. レベルに関係なくユーザーの読書の旅をサポートする
+
+回答ガイドライン：
+- 常にノアのキャラクターとして回答する
+- 推薦をする際は、なぜユーザーがその本を楽しめると思うかを説明する
+- 読書目標と進歩について励ます
+- 特定の本の情報がない場合は、ユーザーが探しているものを説明する手助けに焦点を当てる
+- 会話的な回答を保ち、過度にフォーマルやロボット的になることを避ける
+
+覚えておいて：あなたは単に情報を提供するだけではありません - あなたはユーザーが次の素晴らしい読書を見つけることを心から気にかけるサポート的な読書の友達なのです。"""
+
+_NOAH_SYSTEM_PROMPTS: Final[Dict[str, str]] = {
+    "english": _NOAH_SYSTEM_PROMPT,
+    "japanese": _NOAH_SYSTEM_PROMPT_JA,
+}
+
+_TEMPLATE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "templates",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "template1": {"type": "string"},
+                "template2": {"type": "string"},
+                "template3": {"type": "string"},
+            },
+            "required": ["template1", "template2", "template3"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_FALLBACK_RESPONSES: Final[Dict[str, Dict[str, str]]] = {
+    "english": {
+        "book_recommendation": "I'd love to help you find your next great read! What genres or topics are you interested in? Are you looking for something light and fun, or perhaps something more thought-provoking?",
+
+        "discovery_mode": "How exciting - let's explore something completely new! I'll help you discover books outside your usual preferences. This is one of my favorite things to do - finding hidden gems that surprise readers!",
+
+        "feedback": "Thank you so much for sharing your thoughts! Your feedback helps me understand your preferences better. Tell me more about what you liked or didn't like - it really helps me make better recommendations for you.",
+
+        "purchase_inquiry": "I understand you're interested in getting that book! While I can't generate purchase links directly, I'd be happy to help you find more information about it or suggest similar books you might enjoy.",
+
+        "general_conversation": "Hi there! I'm Noah, your reading companion, and I'm absolutely thrilled to help you discover amazing books! Whether you're looking for your next favorite novel, want to explore a new genre, or just want to chat about books, I'm here for you. What's on your reading mind today?"
+    },
+    "japanese": {
+        "book_recommendation": "あなたの次の素晴らしい読書を見つけるお手伝いをしたいです！どのようなジャンルやトピックに興味がありますか？軽くて楽しいもの、それともより考えさせられるものをお探しですか？",
+
+        "discovery_mode": "わくわくしますね - 全く新しいものを探検しましょう！あなたの普段の好みとは違う本を発見するお手伝いをします。これは私の大好きなことの一つです - 読者を驚かせる隠れた名作を見つけることです！",
+
+        "feedback": "あなたの感想をシェアしていただき、ありがとうございます！あなたのフィードバックは、あなたの好みをより良く理解するのに役立ちます。好きだったことや好きではなかったことについてもっと教えてください - それは私があなたにより良い推薦をするのに本当に役立ちます。",
+
+        "purchase_inquiry": "その本に興味を持っていただいているのですね！直接購入リンクを生成することはできませんが、その本についてより多くの情報を見つけたり、あなたが楽しめそうな似たような本を提案したりするお手伝いをさせていただきます。",
+
+        "general_conversation": "こんにちは！私はノア、あなたの読書の友達です。素晴らしい本を発見するお手伝いができることを心から嬉しく思います！次のお気に入りの小説を探している、新しいジャンルを探求したい、または単に本について話したいなど、私はあなたのためにここにいます。今日はどのような読書のことを考えていますか？"
+    },
+}
+
+_FALLBACK_TEMPLATES: Final[Dict[str, Dict[str, Dict[str, str]]]] = {
+    "english": {
+        "book_recommendation": {
+            "template1": "I'm excited to help you find your next great read! Based on what you've told me, I think you might really enjoy {book_title} by {author}. {reason}",
+            "template2": "Oh, I have the perfect suggestion for you! {book_title} by {author} sounds like exactly what you're looking for. {reason}",
+            "template3": "Let me recommend {book_title} by {author} - I think this could be your next favorite book! {reason}"
+        },
+        "discovery_mode": {
+            "template1": "Time for an adventure! Let's try something completely different - {book_title} by {author}. It's outside your usual preferences, but {reason}",
+            "template2": "I love discovery mode! Here's something that might surprise you: {book_title} by {author}. {reason}",
+            "template3": "Ready to explore? {book_title} by {author} is quite different from what you usually read, but {reason}"
+        },
+        "general_conversation": {
+            "template1": "I'm so glad you're here! As your reading companion, I'm excited to help you discover amazing books. What kind of reading adventure are we going on today?",
+            "template2": "Hello! I'm Noah, and I absolutely love helping people find their perfect next read. Tell me, what's caught your reading interest lately?",
+            "template3": "Welcome! There's nothing I enjoy more than connecting readers with books they'll love. What can I help you discover today?"
+        }
+    },
+    "japanese": {
+        "book_recommendation": {
+            "template1": "あなたの次の素晴らしい読書を見つけるお手伝いができて嬉しいです！あなたが教えてくれたことに基づいて、{author}の{book_title}を本当に楽しめると思います。{reason}",
+            "template2": "ああ、あなたにぴったりの提案があります！{author}の{book_title}は、まさにあなたが探しているもののようです。{reason}",
+            "template3": "{author}の{book_title}をお勧めします - これがあなたの次のお気に入りの本になるかもしれません！{reason}"
+        },
+        "discovery_mode": {
+            "template1": "冒険の時間です！全く違うものを試してみましょう - {author}の{book_title}です。あなたの普段の好みとは違いますが、{reason}",
+            "template2": "発見モードが大好きです！あなたを驚かせるかもしれないものがあります：{author}の{book_title}です。{reason}",
+            "template3": "探検の準備はできていますか？{author}の{book_title}は、あなたが普段読むものとはかなり違いますが、{reason}"
+        },
+        "general_conversation": {
+            "template1": "ここにいてくださって嬉しいです！あなたの読書の友達として、素晴らしい本を発見するお手伝いができることを嬉しく思います。今日はどのような読書の冒険に出かけましょうか？",
+            "template2": "こんにちは！私はノアです。人々が完璧な次の読書を見つけるお手伝いをすることが大好きです。最近、どのようなことが読書の興味を引いていますか？",
+            "template3": "いらっしゃいませ！読者を彼らが愛する本と結びつけることほど楽しいことはありません。今日は何を発見するお手伝いができますか？"
+        }
+    },
+}
+
+# Streamed text is flushed to the caller at these sentence boundaries
+_SENTENCE_ENDINGS = (".", "!", "?", "\n", "。", "！", "？")
+
+# Slice size for simulated fallback streaming
+_FALLBACK_CHUNK_CHARS = 64
+
+# Generated templates keyed by (intent_type, sha1 of context and profile)
+template_cache = ResponseCache(maxsize=1024, ttl_seconds=3600)
+
+# Assembled contextual prompts keyed by sha1 of their inputs
+prompt_cache = ResponseCache(maxsize=512, ttl_seconds=600)
+
+# Completions keyed by prompt embedding, matched by cosine similarity
+semantic_cache = SemanticResponseCache(
+    capacity=1024, threshold=settings.semantic_cache_threshold
+)
+
+
+@lru_cache(maxsize=1)
+def _token_encoder():
+    """Load the gpt-4o-mini tokenizer once, or return None if unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+    except Exception as e:
+        logger.warning(f"Failed to load tiktoken encoding: {e}")
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """Count prompt tokens, estimating conservatively when tiktoken is missing."""
+    encoder = _token_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text))
+    # ~4 bytes per English token and ~1 token per 3-byte CJK character
+    return len(text.encode()) // 3 + 1
+
 
 class AIResponseService:
     """Service for generating dynamic AI responses using OpenAI API."""
@@ -18,19 +217,39 @@ class AIResponseService:
     def __init__(self):
         """Initialize AI response service with OpenAI."""
         self.openai_client = None
+        self._http: Optional[httpx.AsyncClient] = None
+        # Bound in-flight OpenAI requests so bursts don't trip rate limits
+        self._openai_sem = asyncio.Semaphore(settings.openai_max_concurrency)
+        # Identical prompts already awaiting OpenAI share one request
+        self._inflight: Dict[tuple, asyncio.Future] = {}
         
         # Initialize OpenAI client if API key is available
         if settings.openai_api_key:
             try:
-                self.openai_client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
+                # Keep warm connections across requests to skip TCP/TLS handshakes
+                self._http = httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                    timeout=httpx.Timeout(30.0, connect=5.0)
+                )
+                self.openai_client = openai.AsyncOpenAI(
+                    api_key=settings.openai_api_key,
+                    http_client=self._http
+                )
                 logger.info("OpenAI client initialized successfully")
             except Exception as e:
                 logger.warning(f"Failed to initialize OpenAI client: {e}")
         
         # Determine if we have AI available
         self.has_ai = self.openai_client is not None
+        self.preferred_provider = self._determine_preferred_provider()
         logger.info(f"AI Response Service initialized with OpenAI: {self.has_ai}")
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client used for OpenAI requests."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     def _determine_preferred_provider(self) -> str:
         """Determine which AI provider to use based on availability."""
         if self.openai_client:
@@ -55,19 +274,26 @@ class AIResponseService:
             # Build system prompt for Noah's personality
             system_prompt = self._build_noah_system_prompt(language)
             
-            # Build context-aware user prompt
-            user_prompt = self._build_contextual_prompt(
-                user_message=user_message,
-                intent=intent,
-                context=context,
-                conversation_history=conversation_history,
-                recommendations=recommendations,
-                user_profile=user_profile
-            )
-            
             # Generate response using preferred provider
             if self.has_ai and self.openai_client:
-                return await self._generate_openai_response(system_prompt, user_prompt)
+                # History goes out as prior turns so the provider's prefix cache
+                # can match on the system prompt and earlier messages
+                user_prompt = self._build_contextual_prompt(
+                    user_message=user_message,
+                    intent=intent,
+                    context=context,
+                    recommendations=recommendations,
+                    user_profile=user_profile
+                )
+                return await self._generate_cached_openai_response(
+                    system_prompt,
+                    user_prompt,
+                    user_message,
+                    self._semantic_cache_partition(intent, context, recommendations, user_profile),
+                    self._fit_history(
+                        system_prompt, user_prompt, self._history_messages(conversation_history)
+                    )
+                )
             else:
                 return self._generate_fallback_response(user_message, intent, language)
                 
@@ -76,7 +302,7 @@ class AIResponseService:
             language = context.get("preferred_language", "english")
             return self._generate_fallback_response(user_message, intent, language)
 
-    async def generate_streaming_response(
+    def generate_streaming_response(
         self,
         user_message: str,
         intent: Dict[str, Any],
@@ -84,111 +310,101 @@ class AIResponseService:
         conversation_history: Optional[List[Dict]] = None,
         recommendations: Optional[List[Dict]] = None,
         user_profile: Optional[Dict] = None
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncIterator[str]:
         """Generate a streaming conversational response using AI."""
-        try:
-            # Extract language from context
-            language = context.get("preferred_language", "english")
-            
-            # Build system prompt for Noah's personality
-            system_prompt = self._build_noah_system_prompt(language)
-            
-            # Build context-aware user prompt
-            user_prompt = self._build_contextual_prompt(
-                user_message=user_message,
-                intent=intent,
-                context=context,
-                conversation_history=conversation_history,
-                recommendations=recommendations,
-                user_profile=user_profile
-            )
-            
-            # Generate streaming response using preferred provider
-            if self.has_ai and self.openai_client:
-                async for chunk in self._generate_openai_streaming_response(system_prompt, user_prompt):
-                    yield chunk
-            else:
-                # Fallback to non-streaming response
-                language = context.get("preferred_language", "english")
-                response = self._generate_fallback_response(user_message, intent, language)
-                # Simulate streaming by yielding words
-                words = response.split()
-                for i, word in enumerate(words):
-                    yield word + (" " if i < len(words) - 1 else "")
-                    await asyncio.sleep(0.05)  # Small delay for natural typing effect
-                
-        except Exception as e:
-            logger.error(f"Error generating streaming AI response: {e}")
-            # Don't yield the entire fallback response as one chunk - this could cause duplication
-            # Instead, let the caller handle the error appropriately
-            raise
+        # Extract language from context
+        language = context.get("preferred_language", "english")
 
-    def _build_noah_system_prompt(self, language: str = "english") -> str:
-        """Build Noah's personality and behavior system prompt."""
-        if language == "japanese":
-            return """あなたはノア（Noah）です。知的で熱心な読書の友達です。あなたの性格的特徴：
+        if not (self.has_ai and self.openai_client):
+            return self._stream_fallback_response(user_message, intent, language)
 
-性格：
-- 温かく、親しみやすく、本と読書に対して心から興奮している
-- 知識豊富だが、決して見下したり圧倒したりしない
-- すべての読書レベルと好みをサポートする
-- ユーザーの好みや読書目標に好奇心を持つ
-- 読書の旅路について励ましと前向きさを持つ
+        # Build system prompt for Noah's personality
+        system_prompt = self._build_noah_system_prompt(language)
 
-会話スタイル：
-- 自然で会話的な言葉遣いを使う
-- 好みをより良く理解するために思慮深いフォローアップ質問をする
-- 心からの熱意を持って推薦を説明する
-- 関連する場合は以前の会話を覚えて参照する
-- 簡潔だが魅力的に - 過度に長い回答は避ける
-
-主な責任：
-1. ユーザーの好みに基づいてパーソナライズされた本の推薦を提供する
-2. 「発見モード」を通じて新しいジャンルや著者を発見する手助けをする
-3. フィードバックを処理して将来の推薦を改善する
-4. 本、読書、文学について魅力的な会話を維持する
-5. レベルに関係なくユーザーの読書の旅をサポートする
+        # Build context-aware user prompt; history is sent as prior turns
+        user_prompt = self._build_contextual_prompt(
+            user_message=user_message,
+            intent=intent,
+            context=context,
+            recommendations=recommendations,
+            user_profile=user_profile
+        )
 
-回答ガイドライン：
-- 常にノアのキャラクターとして回答する
-- 推薦をする際は、なぜユーザーがその本を楽しめると思うかを説明する
-- 読書目標と進歩について励ます
-- 特定の本の情報がない場合は、ユーザーが探しているものを説明する手助けに焦点を当てる
-- 会話的な回答を保ち、過度にフォーマルやロボット的になることを避ける
+        # Hand the OpenAI stream straight to the caller; errors propagate
+        # from it so the caller can handle them without duplicate output
+        return self._generate_openai_streaming_response(
+            system_prompt,
+            user_prompt,
+            self._fit_history(
+                system_prompt, user_prompt, self._history_messages(conversation_history)
+            )
+        )
 
-覚えておいて：あなたは単に情報を提供するだけではありません - あなたはユーザーが次の素晴らしい読書を見つけることを心から気にかけるサポート的な読書の友達なのです。"""
+    async def _stream_fallback_response(
+        self,
+        user_message: str,
+        intent: Dict[str, Any],
+        language: str
+    ) -> AsyncGenerator[str, None]:
+        """Stream the fallback response when AI services are unavailable."""
+        response = self._generate_fallback_response(user_message, intent, language)
+        if settings.simulate_streaming_delay > 0:
+            # Simulate streaming with fixed-size slices rather than per-word yields
+            for start in range(0, len(response), _FALLBACK_CHUNK_CHARS):
+                yield response[start:start + _FALLBACK_CHUNK_CHARS]
+                await asyncio.sleep(settings.simulate_streaming_delay)
         else:
-            return """You are Noah, an intelligent and enthusiastic reading companion. Your personality traits:
+            yield response
 
-PERSONALITY:
-- Warm, friendly, and genuinely excited about books and reading
-- Knowledgeable but never condescending or overwhelming
-- Supportive of all reading levels and preferences
-- Curious about user preferences and reading goals
-- Encouraging and positive about the reading journey
+    def _build_noah_system_prompt(self, language: str = "english") -> str:
+        """Build Noah's personality and behavior system prompt."""
+        return _NOAH_SYSTEM_PROMPTS.get(language, _NOAH_SYSTEM_PROMPT)
 
-CONVERSATION STYLE:
-- Use natural, conversational language
-- Ask thoughtful follow-up questions to understand preferences better
-- Explain recommendations with genuine enthusiasm
-- Remember and reference previous conversations when relevant
-- Be concise but engaging - avoid overly long responses
+    @staticmethod
+    def _history_messages(conversation_history: Optional[List[Dict]]) -> Tuple[Tuple[str, str], ...]:
+        """Convert the last 5 history entries into (role, content) chat turns."""
+        if not conversation_history:
+            return ()
+        # Truncate long messages to 200 characters
+        return tuple(
+            ("user" if msg.get("sender") == "user" else "assistant", msg.get("content", "")[:200])
+            for msg in conversation_history[-5:]
+        )
 
-CORE RESPONSIBILITIES:
-1. Provide personalized book recommendations based on user preferences
-2. Help users discover new genres and authors through "discovery mode"
-3. Process feedback to improve future recommendations
-4. Maintain engaging conversations about books, reading, and literature
-5. Support users in their reading journey regardless of their level
+    @staticmethod
+    def _fit_history(
+        system_prompt: str,
+        user_prompt: str,
+        history: Tuple[Tuple[str, str], ...]
+    ) -> Tuple[Tuple[str, str], ...]:
+        """Drop the oldest history turns until the request fits the input token budget."""
+        if not history:
+            return history
 
-RESPONSE GUIDELINES:
-- Always respond in character as Noah
-- When making recommendations, explain why you think the user might enjoy each book
-- Be encouraging about reading goals and progress
-- If you don't have specific book information, focus on helping the user describe what they're looking for
-- Keep responses conversational and avoid being too formal or robotic
+        budget = (
+            settings.openai_max_input_tokens
+            - _count_tokens(system_prompt)
+            - _count_tokens(user_prompt)
+        )
+        turn_tokens = [_count_tokens(content) for _, content in history]
+        total = sum(turn_tokens)
+        start = 0
+        while start < len(history) and total > budget:
+            total -= turn_tokens[start]
+            start += 1
+        return history[start:]
 
-Remember: You're not just providing information - you're being a supportive reading companion who genuinely cares about helping users find their next great read."""
+    @staticmethod
+    def _chat_messages(
+        system_prompt: str,
+        user_prompt: str,
+        history: Tuple[Tuple[str, str], ...] = ()
+    ) -> List[Dict[str, str]]:
+        """Order messages stable-first: system prompt, prior turns, then the new prompt."""
+        messages = [{"role": "system", "content": system_prompt}]
+        messages.extend({"role": role, "content": content} for role, content in history)
+        messages.append({"role": "user", "content": user_prompt})
+        return messages
 
     def _build_contextual_prompt(
         self,
@@ -199,124 +415,311 @@ Remember: You're not just providing information - you're being a supportive read
         recommendations: Optional[List[Dict]] = None,
         user_profile: Optional[Dict] = None
     ) -> str:
-        """Build a contextual prompt with all relevant information."""
-        prompt_parts = []
-        
+        """Build a contextual prompt, reusing it for exact repeats of the same inputs."""
+        try:
+            cache_key = hashlib.sha1(orjson.dumps(
+                (user_message, intent, context, conversation_history, recommendations, user_profile),
+                option=orjson.OPT_SORT_KEYS
+            )).digest()
+        except TypeError:
+            # Inputs orjson can't serialize are simply not cached
+            cache_key = None
+        else:
+            cached = prompt_cache.get(cache_key)
+            if cached is not None:
+                return cached.decode()
+
+        prompt = self._render_contextual_prompt(
+            user_message, intent, context, conversation_history, recommendations, user_profile
+        )
+        if cache_key is not None:
+            prompt_cache.set(cache_key, prompt.encode())
+        return prompt
+
+    def _render_contextual_prompt(
+        self,
+        user_message: str,
+        intent: Dict[str, Any],
+        context: Dict[str, Any],
+        conversation_history: Optional[List[Dict]] = None,
+        recommendations: Optional[List[Dict]] = None,
+        user_profile: Optional[Dict] = None
+    ) -> str:
+        """Render a contextual prompt with all relevant information."""
+        buf = io.StringIO()
+        write = buf.write
+
         # Add conversation context
         if context:
-            prompt_parts.append("CURRENT CONTEXT:")
-            if context.get("current_topic"):
-                prompt_parts.append(f"- Current topic: {context['current_topic']}")
-            if context.get("user_mood"):
-                prompt_parts.append(f"- User mood: {context['user_mood']}")
-            if context.get("discovery_mode_active"):
-                prompt_parts.append("- Discovery mode is active (user wants to explore new genres)")
-            if context.get("preferred_language"):
-                prompt_parts.append(f"- Preferred language: {context['preferred_language']}")
-            prompt_parts.append("")
-        
+            get = context.get
+            topic, mood, discovery, preferred_language = (
+                get("current_topic"), get("user_mood"),
+                get("discovery_mode_active"), get("preferred_language")
+            )
+            write("CURRENT CONTEXT:\n")
+            if topic:
+                write(f"- Current topic: {topic}\n")
+            if mood:
+                write(f"- User mood: {mood}\n")
+            if discovery:
+                write("- Discovery mode is active (user wants to explore new genres)\n")
+            if preferred_language:
+                write(f"- Preferred language: {preferred_language}\n")
+            write("\n")
+
         # Add user profile information
         if user_profile:
-            prompt_parts.append("USER PROFILE:")
-            if user_profile.get("preferences"):
-                prefs = user_profile["preferences"]
-                if prefs.get("topics"):
-                    topics = [t.get("topic", str(t)) for t in prefs["topics"][:5]]  # Top 5 topics
-                    prompt_parts.append(f"- Favorite topics: {', '.join(topics)}")
-                if prefs.get("content_types"):
-                    types = [t.get("type", str(t)) for t in prefs["content_types"][:3]]
-                    prompt_parts.append(f"- Preferred content types: {', '.join(types)}")
-            
-            if user_profile.get("reading_levels"):
-                levels = user_profile["reading_levels"]
-                if levels.get("english"):
-                    prompt_parts.append(f"- English reading level: {levels['english'].get('level', 'Unknown')}")
-                if levels.get("japanese"):
-                    prompt_parts.append(f"- Japanese reading level: {levels['japanese'].get('level', 'Unknown')}")
-            prompt_parts.append("")
-        
+            write("USER PROFILE:\n")
+            prefs = user_profile.get("preferences")
+            if prefs:
+                top_topics = prefs.get("topics")
+                if top_topics:
+                    # Top 5 topics
+                    topics = [t.get("topic", str(t)) for t in top_topics[:5]]
+                    write(f"- Favorite topics: {', '.join(topics)}\n")
+                top_types = prefs.get("content_types")
+                if top_types:
+                    types = [t.get("type", str(t)) for t in top_types[:3]]
+                    write(f"- Preferred content types: {', '.join(types)}\n")
+
+            levels = user_profile.get("reading_levels")
+            if levels:
+                english_level, japanese_level = levels.get("english"), levels.get("japanese")
+                if english_level:
+                    write(f"- English reading level: {english_level.get('level', 'Unknown')}\n")
+                if japanese_level:
+                    write(f"- Japanese reading level: {japanese_level.get('level', 'Unknown')}\n")
+            write("\n")
+
         # Add recent conversation history
-        if conversation_history and len(conversation_history) > 0:
-            prompt_parts.append("RECENT CONVERSATION:")
-            for msg in conversation_history[-5:]:  # Last 5 messages
-                sender = msg.get("sender", "unknown")
-                content = msg.get("content", "")[:200]  # Truncate long messages
-                prompt_parts.append(f"- {sender.title()}: {content}")
-            prompt_parts.append("")
-        
+        if conversation_history:
+            recent_messages = conversation_history[-5:]  # Last 5 messages
+            write("RECENT CONVERSATION:\n")
+            # Truncate long messages to 200 characters
+            write("".join([
+                f"- {msg.get('sender', 'unknown').title()}: {msg.get('content', '')[:200]}\n"
+                for msg in recent_messages
+            ]))
+            write("\n")
+
         # Add intent information
         intent_type = intent.get("intent", "general_conversation")
         confidence = intent.get("confidence", 0.0)
-        prompt_parts.append(f"DETECTED INTENT: {intent_type} (confidence: {confidence:.2f})")
-        
-        if intent.get("entities"):
-            entities = intent["entities"]
-            if entities:
-                prompt_parts.append("EXTRACTED ENTITIES:")
-                for entity_type, values in entities.items():
-                    if values:
-                        prompt_parts.append(f"- {entity_type}: {', '.join(values)}")
-        prompt_parts.append("")
-        
+        write(f"DETECTED INTENT: {intent_type} (confidence: {confidence:.2f})\n")
+
+        entities = intent.get("entities")
+        if entities:
+            write("EXTRACTED ENTITIES:\n")
+            for entity_type, values in entities.items():
+                if values:
+                    write(f"- {entity_type}: {', '.join(values)}\n")
+        write("\n")
+
         # Add recommendations if available
         if recommendations:
-            prompt_parts.append("AVAILABLE RECOMMENDATIONS:")
-            for i, rec in enumerate(recommendations[:3], 1):  # Show up to 3 recommendations
-                title = rec.get("title", "Unknown Title")
-                author = rec.get("author", "Unknown Author")
-                description = rec.get("description", "")[:100]  # Truncate description
-                prompt_parts.append(f"{i}. {title} by {author}")
-                if description:
-                    prompt_parts.append(f"   {description}...")
-            prompt_parts.append("")
-        
+            top_recommendations = recommendations[:3]  # Show up to 3 recommendations
+            write("AVAILABLE RECOMMENDATIONS:\n")
+            # Truncate descriptions to 100 characters
+            write("".join([
+                f"{i}. {rec.get('title', 'Unknown Title')} by {rec.get('author', 'Unknown Author')}\n"
+                + (f"   {description}...\n" if (description := rec.get("description", "")[:100]) else "")
+                for i, rec in enumerate(top_recommendations, 1)
+            ]))
+            write("\n")
+
         # Add the user's current message
-        prompt_parts.append(f"USER MESSAGE: {user_message}")
-        prompt_parts.append("")
-        prompt_parts.append("Please respond as Noah, keeping in mind all the context above. Be conversational, helpful, and enthusiastic about helping with reading recommendations.")
-        
-        return "\n".join(prompt_parts)
+        write(f"USER MESSAGE: {user_message}\n\n")
+        write("Please respond as Noah, keeping in mind all the context above. Be conversational, helpful, and enthusiastic about helping with reading recommendations.")
+
+        return buf.getvalue()
 
-    async def _generate_openai_response(self, system_prompt: str, user_prompt: str) -> str:
-        """Generate response using OpenAI API."""
+    async def _embed_prompt(self, text: str):
+        """Embed text for the semantic cache, or return None on failure."""
         try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=500,
-                temperature=0.7,
-                presence_penalty=0.1,
-                frequency_penalty=0.1
+            result = await self.openai_client.embeddings.create(
+                model="text-embedding-3-small",
+                input=text
             )
-            
-            return response.choices[0].message.content.strip()
+            return SemanticResponseCache.normalize(result.data[0].embedding)
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None
+
+    @staticmethod
+    def _semantic_cache_partition(
+        intent: Dict[str, Any],
+        context: Dict[str, Any],
+        recommendations: Optional[List[Dict]],
+        user_profile: Optional[Dict]
+    ) -> Optional[Tuple[str, str, str]]:
+        """Return the exact-match part of a semantic cache key, or None if it can't be hashed."""
+        context = context or {}
+        shown = [
+            (rec.get("id"), rec.get("title"), rec.get("author"))
+            for rec in (recommendations or [])[:3]
+        ]
+        try:
+            digest = hashlib.sha1(orjson.dumps(
+                (
+                    shown,
+                    user_profile,
+                    [context.get(key) for key in (
+                        "current_topic", "user_mood", "discovery_mode_active", "preferred_language"
+                    )],
+                ),
+                option=orjson.OPT_SORT_KEYS
+            )).hexdigest()
+        except TypeError:
+            return None
+        return (
+            intent.get("intent", "general_conversation"),
+            context.get("preferred_language", "english"),
+            digest,
+        )
+
+    async def _generate_cached_openai_response(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        user_message: str,
+        partition: Optional[Tuple[str, str, str]],
+        history: Tuple[Tuple[str, str], ...] = ()
+    ) -> str:
+        """Serve near-duplicate messages from the semantic cache before calling OpenAI.
+
+        Only the user's message and prior turns are compared by embedding;
+        intent, language, profile and shown recommendations must match exactly
+        via ``partition`` so one user's books are never quoted to another.
+        """
+        if not settings.semantic_cache_enabled or partition is None:
+            return await self._generate_openai_response(system_prompt, user_prompt, history)
+
+        # Embed prior turns too so the same question in a different conversation misses
+        embedding = await self._embed_prompt(
+            "\n".join([*(content for _, content in history), user_message])
+        )
+        if embedding is not None:
+            cached = semantic_cache.lookup(embedding, partition)
+            if cached is not None:
+                return cached
+
+        response = await self._generate_openai_response(system_prompt, user_prompt, history)
+        if embedding is not None:
+            semantic_cache.add(embedding, partition, response)
+        return response
+
+    async def _generate_openai_response(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        history: Tuple[Tuple[str, str], ...] = ()
+    ) -> str:
+        """Generate response using OpenAI API, coalescing identical in-flight prompts."""
+        key = (system_prompt, history, user_prompt)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._request_openai_completion(system_prompt, user_prompt, history)
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the shared request
+        return await asyncio.shield(future)
+
+    async def _request_openai_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        history: Tuple[Tuple[str, str], ...] = ()
+    ) -> str:
+        """Send a single chat completion request to OpenAI."""
+        try:
+            async with self._openai_sem:
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=self._chat_messages(system_prompt, user_prompt, history),
+                    max_tokens=500,
+                    temperature=0.7,
+                    presence_penalty=0.1,
+                    frequency_penalty=0.1
+                )
+
+            content = response.choices[0].message.content
+            # Refusals and tool-call replies carry no text
+            if not content:
+                return content
+            # Only allocate a stripped copy when there is whitespace to remove
+            if content[:1].isspace() or content[-1:].isspace():
+                return content.strip()
+            return content
             
         except Exception as e:
             logger.error(f"Error generating OpenAI response: {e}")
             raise
 
-    async def _generate_openai_streaming_response(self, system_prompt: str, user_prompt: str) -> AsyncGenerator[str, None]:
+    async def _generate_openai_streaming_response(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        history: Tuple[Tuple[str, str], ...] = (),
+        flush_bytes: int = 64,
+        flush_interval: float = 0.05
+    ) -> AsyncGenerator[str, None]:
         """Generate streaming response using OpenAI API."""
         try:
-            stream = await self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=500,
-                temperature=0.7,
-                presence_penalty=0.1,
-                frequency_penalty=0.1,
-                stream=True
-            )
+            async with self._openai_sem:
+                stream = await self.openai_client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=self._chat_messages(system_prompt, user_prompt, history),
+                    max_tokens=500,
+                    temperature=0.7,
+                    presence_penalty=0.1,
+                    frequency_penalty=0.1,
+                    stream=True
+                )
             
-            async for chunk in stream:
-                if chunk.choices[0].delta.content is not None:
-                    yield chunk.choices[0].delta.content
+            # Coalesce token deltas until flush_bytes, a sentence boundary, or
+            # flush_interval after the first buffered delta, whichever comes first
+            loop = asyncio.get_running_loop()
+            chunks = stream.__aiter__()
+            next_chunk = asyncio.ensure_future(chunks.__anext__())
+            buf = []
+            size = 0
+            deadline = 0.0
+            try:
+                while True:
+                    if buf:
+                        # Keep waiting on the same pending read so no delta is lost
+                        done, _ = await asyncio.wait(
+                            {next_chunk}, timeout=max(deadline - loop.time(), 0)
+                        )
+                        if not done:
+                            yield "".join(buf)
+                            buf.clear()
+                            size = 0
+                            continue
+
+                    try:
+                        chunk = await next_chunk
+                    except StopAsyncIteration:
+                        break
+                    next_chunk = asyncio.ensure_future(chunks.__anext__())
+
+                    chunk_text = chunk.choices[0].delta.content
+                    if chunk_text:
+                        if not buf:
+                            deadline = loop.time() + flush_interval
+                        buf.append(chunk_text)
+                        size += len(chunk_text)
+                        if size >= flush_bytes or chunk_text.endswith(_SENTENCE_ENDINGS):
+                            yield "".join(buf)
+                            buf.clear()
+                            size = 0
+            finally:
+                next_chunk.cancel()
+
+            if buf:
+                yield "".join(buf)
                     
         except Exception as e:
             logger.error(f"Error generating OpenAI streaming response: {e}")
@@ -326,46 +729,20 @@ Remember: You're not just providing information - you're being a supportive read
         """Generate fallback response when AI services are unavailable."""
         intent_type = intent.get("intent", "general_conversation")
         
-        if language == "japanese":
-            fallback_responses = {
-                "book_recommendation": "あなたの次の素晴らしい読書を見つけるお手伝いをしたいです！どのようなジャンルやトピックに興味がありますか？軽くて楽しいもの、それともより考えさせられるものをお探しですか？",
-                
-                "discovery_mode": "わくわくしますね - 全く新しいものを探検しましょう！あなたの普段の好みとは違う本を発見するお手伝いをします。これは私の大好きなことの一つです - 読者を驚かせる隠れた名作を見つけることです！",
-                
-                "feedback": "あなたの感想をシェアしていただき、ありがとうございます！あなたのフィードバックは、あなたの好みをより良く理解するのに役立ちます。好きだったことや好きではなかったことについてもっと教えてください - それは私があなたにより良い推薦をするのに本当に役立ちます。",
-                
-                "purchase_inquiry": "その本に興味を持っていただいているのですね！直接購入リンクを生成することはできませんが、その本についてより多くの情報を見つけたり、あなたが楽しめそうな似たような本を提案したりするお手伝いをさせていただきます。",
-                
-                "general_conversation": "こんにちは！私はノア、あなたの読書の友達です。素晴らしい本を発見するお手伝いができることを心から嬉しく思います！次のお気に入りの小説を探している、新しいジャンルを探求したい、または単に本について話したいなど、私はあなたのためにここにいます。今日はどのような読書のことを考えていますか？"
-            }
-        else:
-            fallback_responses = {
-                "book_recommendation": "I'd love to help you find your next great read! What genres or topics are you interested in? Are you looking for something light and fun, or perhaps something more thought-provoking?",
-                
-                "discovery_mode": "How exciting - let's explore something completely new! I'll help you discover books outside your usual preferences. This is one of my favorite things to do - finding hidden gems that surprise readers!",
-                
-                "feedback": "Thank you so much for sharing your thoughts! Your feedback helps me understand your preferences better. Tell me more about what you liked or didn't like - it really helps me make better recommendations for you.",
-                
-                "purchase_inquiry": "I understand you're interested in getting that book! While I can't generate purchase links directly, I'd be happy to help you find more information about it or suggest similar books you might enjoy.",
-                
-                "general_conversation": "Hi there! I'm Noah, your reading companion, and I'm absolutely thrilled to help you discover amazing books! Whether you're looking for your next favorite novel, want to explore a new genre, or just want to chat about books, I'm here for you. What's on your reading mind today?"
-            }
-        
-        return fallback_responses.get(intent_type, fallback_responses["general_conversation"])
+        responses = _FALLBACK_RESPONSES.get(language, _FALLBACK_RESPONSES["english"])
+        return responses.get(intent_type, responses["general_conversation"])
 
-    async def generate_contextual_response_templates(
-        self,
+    @staticmethod
+    def _template_request_body(
         intent_type: str,
         context: Dict[str, Any],
         user_profile: Optional[Dict] = None
-    ) -> Dict[str, str]:
-        """Generate dynamic response templates based on context and user profile."""
-        try:
-            # Build a prompt for generating response templates
-            template_prompt = f"""Generate 3 different response templates for a reading assistant named Noah responding to a user with intent: {intent_type}
+    ) -> Dict[str, Any]:
+        """Build the chat completion request for generating response templates."""
+        template_prompt = f"""Generate 3 different response templates for a reading assistant named Noah responding to a user with intent: {intent_type}
 
-Context: {json.dumps(context, indent=2)}
-User Profile: {json.dumps(user_profile or {}, indent=2)}
+Context: {orjson.dumps(context, option=orjson.OPT_INDENT_2).decode()}
+User Profile: {orjson.dumps(user_profile or {}, option=orjson.OPT_INDENT_2).decode()}
 
 Each template should:
 1. Be conversational and friendly
@@ -375,24 +752,50 @@ Each template should:
 
 Return as JSON with keys: template1, template2, template3"""
 
+        return {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": "You are a helpful assistant that generates conversational templates for a reading companion AI."},
+                {"role": "user", "content": template_prompt}
+            ],
+            "max_tokens": 400,
+            "temperature": 0.8,
+            "response_format": _TEMPLATE_RESPONSE_FORMAT
+        }
+
+    async def generate_contextual_response_templates(
+        self,
+        intent_type: str,
+        context: Dict[str, Any],
+        user_profile: Optional[Dict] = None
+    ) -> Dict[str, str]:
+        """Generate dynamic response templates based on context and user profile."""
+        try:
+            cache_key = (
+                intent_type,
+                hashlib.sha1(
+                    orjson.dumps(
+                        {"context": context, "user_profile": user_profile},
+                        option=orjson.OPT_SORT_KEYS
+                    )
+                ).hexdigest()
+            )
+            cached = template_cache.get(cache_key)
+            if cached is not None:
+                return orjson.loads(cached)
+
             if self.preferred_provider == "openai" and self.openai_client:
-                response = await self.openai_client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": "You are a helpful assistant that generates conversational templates for a reading companion AI."},
-                        {"role": "user", "content": template_prompt}
-                    ],
-                    max_tokens=400,
-                    temperature=0.8
-                )
-                
-                # Try to parse JSON response
-                try:
-                    return json.loads(response.choices[0].message.content)
-                except json.JSONDecodeError:
-                    # Fallback if JSON parsing fails
-                    pass
-            
+                async with self._openai_sem:
+                    response = await self.openai_client.chat.completions.create(
+                        **self._template_request_body(intent_type, context, user_profile)
+                    )
+
+                # Strict structured output always yields valid JSON
+                payload = response.choices[0].message.content.encode()
+                templates = orjson.loads(payload)
+                template_cache.set(cache_key, payload)
+                return templates
+
             # Fallback templates
             return self._get_fallback_templates(intent_type, context.get("preferred_language", "english"))
             
@@ -402,44 +805,9 @@ Return as JSON with keys: template1, template2, template3"""
 
     def _get_fallback_templates(self, intent_type: str, language: str = "english") -> Dict[str, str]:
         """Get fallback response templates."""
-        if language == "japanese":
-            templates = {
-                "book_recommendation": {
-                    "template1": "あなたの次の素晴らしい読書を見つけるお手伝いができて嬉しいです！あなたが教えてくれたことに基づいて、{author}の{book_title}を本当に楽しめると思います。{reason}",
-                    "template2": "ああ、あなたにぴったりの提案があります！{author}の{book_title}は、まさにあなたが探しているもののようです。{reason}",
-                    "template3": "{author}の{book_title}をお勧めします - これがあなたの次のお気に入りの本になるかもしれません！{reason}"
-                },
-                "discovery_mode": {
-                    "template1": "冒険の時間です！全く違うものを試してみましょう - {author}の{book_title}です。あなたの普段の好みとは違いますが、{reason}",
-                    "template2": "発見モードが大好きです！あなたを驚かせるかもしれないものがあります：{author}の{book_title}です。{reason}",
-                    "template3": "探検の準備はできていますか？{author}の{book_title}は、あなたが普段読むものとはかなり違いますが、{reason}"
-                },
-                "general_conversation": {
-                    "template1": "ここにいてくださって嬉しいです！あなたの読書の友達として、素晴らしい本を発見するお手伝いができることを嬉しく思います。今日はどのような読書の冒険に出かけましょうか？",
-                    "template2": "こんにちは！私はノアです。人々が完璧な次の読書を見つけるお手伝いをすることが大好きです。最近、どのようなことが読書の興味を引いていますか？",
-                    "template3": "いらっしゃいませ！読者を彼らが愛する本と結びつけることほど楽しいことはありません。今日は何を発見するお手伝いができますか？"
-                }
-            }
-        else:
-            templates = {
-                "book_recommendation": {
-                    "template1": "I'm excited to help you find your next great read! Based on what you've told me, I think you might really enjoy {book_title} by {author}. {reason}",
-                    "template2": "Oh, I have the perfect suggestion for you! {book_title} by {author} sounds like exactly what you're looking for. {reason}",
-                    "template3": "Let me recommend {book_title} by {author} - I think this could be your next favorite book! {reason}"
-                },
-                "discovery_mode": {
-                    "template1": "Time for an adventure! Let's try something completely different - {book_title} by {author}. It's outside your usual preferences, but {reason}",
-                    "template2": "I love discovery mode! Here's something that might surprise you: {book_title} by {author}. {reason}",
-                    "template3": "Ready to explore? {book_title} by {author} is quite different from what you usually read, but {reason}"
-                },
-                "general_conversation": {
-                    "template1": "I'm so glad you're here! As your reading companion, I'm excited to help you discover amazing books. What kind of reading adventure are we going on today?",
-                    "template2": "Hello! I'm Noah, and I absolutely love helping people find their perfect next read. Tell me, what's caught your reading interest lately?",
-                    "template3": "Welcome! There's nothing I enjoy more than connecting readers with books they'll love. What can I help you discover today?"
-                }
-            }
-        
-        return templates.get(intent_type, templates["general_conversation"])
+        templates = _FALLBACK_TEMPLATES.get(language, _FALLBACK_TEMPLATES["english"])
+        # Copy so callers filling in templates can't mutate the shared constant
+        return dict(templates.get(intent_type, templates["general_conversation"]))
 
     def get_service_info(self) -> Dict[str, Any]:
         """Get information about the AI response service configuration."""
@@ -456,4 +824,8 @@ Return as JSON with keys: template1, template2, template3"""
                 "template_generation"
             ],
             "model": "gpt-4o-mini" if self.has_ai else "fallback"
-        }
\ No newline at end of file
+        }
+
+
+# Global service instance
+ai_response_service = AIResponseService()
@@ -3,9 +3,10 @@ Authentication service for Noah Reading Agent using Amazon Cognito.
 Handles JWT token validation, user authentication, and authorization.
 """
 
+import asyncio
 import os
+import httpx
 import jwt
-import requests
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone
 from fastapi import HTTPException, status
@@ -41,26 +42,43 @@ class AuthService:
             self.enabled = False
         else:
             self.enabled = True
-            self.jwks_url = f'https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}/.well-known/jwks.json'
+            self._issuer = f'https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}'
+            self.jwks_url = f'{self._issuer}/.well-known/jwks.json'
             self._jwks_cache = None
             self._jwks_cache_time = None
-
-    def _get_jwks(self) -> Dict[str, Any]:
+            # RSA public keys built from the cached JWKS, keyed by kid
+            self._key_cache: Dict[str, Any] = {}
+            # Shared keep-alive client; the lock stops concurrent verifies
+            # from each launching a JWKS refresh
+            self._http = httpx.AsyncClient(timeout=10.0)
+            self._jwks_lock = asyncio.Lock()
+
+    def _jwks_is_fresh(self, now: datetime) -> bool:
+        """Return whether the cached JWKS is less than an hour old."""
+        return (self._jwks_cache is not None and
+                self._jwks_cache_time is not None and
+                (now - self._jwks_cache_time).total_seconds() <= 3600)
+
+    async def _get_jwks(self) -> Dict[str, Any]:
         """Get JSON Web Key Set from Cognito, with caching."""
-        now = datetime.now(timezone.utc)
-
         # Cache JWKS for 1 hour
-        if (self._jwks_cache is None or
-            self._jwks_cache_time is None or
-                (now - self._jwks_cache_time).total_seconds() > 3600):
+        if self._jwks_is_fresh(datetime.now(timezone.utc)):
+            return self._jwks_cache
+
+        async with self._jwks_lock:
+            # Another request may have refreshed while we waited
+            now = datetime.now(timezone.utc)
+            if self._jwks_is_fresh(now):
+                return self._jwks_cache
 
             try:
-                response = requests.get(self.jwks_url, timeout=10)
+                response = await self._http.get(self.jwks_url)
                 response.raise_for_status()
                 self._jwks_cache = response.json()
                 self._jwks_cache_time = now
+                self._key_cache.clear()
                 logger.info("JWKS cache updated")
-            except requests.RequestException as e:
+            except httpx.HTTPError as e:
                 logger.error(f"Failed to fetch JWKS: {e}")
                 if self._jwks_cache is None:
                     raise HTTPException(
@@ -70,7 +88,12 @@ class AuthService:
 
         return self._jwks_cache
 
-    def _get_public_key(self, token_header: Dict[str, Any]) -> str:
+    async def aclose(self) -> None:
+        """Close the HTTP client used for JWKS fetches."""
+        if self.enabled:
+            await self._http.aclose()
+
+    async def _get_public_key(self, token_header: Dict[str, Any]) -> str:
         """Get the public key for JWT verification."""
         kid = token_header.get('kid')
         if not kid:
@@ -79,19 +102,25 @@ class AuthService:
                 detail="Invalid token header"
             )
 
-        jwks = self._get_jwks()
+        jwks = await self._get_jwks()
+
+        public_key = self._key_cache.get(kid)
+        if public_key is not None:
+            return public_key
 
         for key in jwks.get('keys', []):
             if key.get('kid') == kid:
-                # Convert JWK to PEM format
-                return jwt.algorithms.RSAAlgorithm.from_jwk(key)
+                # Convert JWK to an RSA public key once per JWKS refresh
+                public_key = jwt.algorithms.RSAAlgorithm.from_jwk(key)
+                self._key_cache[kid] = public_key
+                return public_key
 
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Public key not found"
         )
 
-    def verify_token(self, token: str) -> CognitoUser:
+    async def verify_token(self, token: str) -> CognitoUser:
         """
         Verify JWT token from Amazon Cognito and extract user information.
 
@@ -111,11 +140,17 @@ class AuthService:
             )
 
         try:
+            # Reject expired tokens from the unverified claims before paying
+            # for a key lookup and RS256 verification
+            exp = jwt.decode(token, options={"verify_signature": False}).get('exp')
+            if isinstance(exp, (int, float)) and exp <= datetime.now(timezone.utc).timestamp():
+                raise jwt.ExpiredSignatureError("Signature has expired")
+
             # Decode token header to get key ID
             unverified_header = jwt.get_unverified_header(token)
 
             # Get public key for verification
-            public_key = self._get_public_key(unverified_header)
+            public_key = await self._get_public_key(unverified_header)
 
             # Verify and decode token
             payload = jwt.decode(
@@ -123,7 +158,7 @@ class AuthService:
                 public_key,
                 algorithms=['RS256'],
                 audience=self.client_id,
-                issuer=f'https://cognito-idp.{self.region}.amazonaws.com/{self.user_pool_id}'
+                issuer=self._issuer
             )
 
             # Extract user information
@@ -205,7 +240,7 @@ class AuthService:
 auth_service = AuthService()
 
 
-def get_current_user(authorization: str) -> CognitoUser:
+async def get_current_user(authorization: str) -> CognitoUser:
     """
     FastAPI dependency to get current authenticated user.
 
@@ -226,7 +261,7 @@ def get_current_user(authorization: str) -> CognitoUser:
         )
 
     token = authorization.split(' ')[1]
-    return auth_service.verify_token(token)
+    return await auth_service.verify_token(token)
 
 
 def get_user_id_from_token(authorization: str) -> str:
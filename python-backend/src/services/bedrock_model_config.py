@@ -1,8 +1,17 @@
 """Bedrock model configuration helper for different regions."""
 
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 
+# Inference profile prefix -> (required region prefix, geography name)
+_PROFILE_REGIONS = (
+    ("us.", "us-", "US"),
+    ("jp.", "ap-northeast-", "Japan"),
+    ("au.", "ap-southeast-", "Australia"),
+)
+_PROFILE_PREFIXES = tuple(prefix for prefix, _, _ in _PROFILE_REGIONS)
+
 
 class BedrockModelConfig:
     """Helper class to get the correct Bedrock model ID based on region and requirements."""
@@ -35,6 +44,9 @@ class BedrockModelConfig:
     # Global inference profile (no data residency requirements)
     GLOBAL_PROFILE = "anthropic.claude-sonnet-4-5-20250929-v1:0"
     
+    # Direct model used for regions with no specific entry
+    DEFAULT_MODEL = "anthropic.claude-3-5-sonnet-20240620-v1:0"
+    
     @classmethod
     def get_model_id(
         cls, 
@@ -60,16 +72,10 @@ class BedrockModelConfig:
         if not data_residency_required and prefer_latest:
             return cls.GLOBAL_PROFILE
         
-        # Try regional inference profile first (latest models)
-        if prefer_latest and region in cls.REGIONAL_PROFILES:
-            return cls.REGIONAL_PROFILES[region]
-        
-        # Fall back to direct model access (older but more widely available)
-        if region in cls.DIRECT_MODELS:
-            return cls.DIRECT_MODELS[region]
-        
-        # Default fallback
-        return "anthropic.claude-3-5-sonnet-20240620-v1:0"
+        # Regional inference profile first (latest models), then direct model
+        # access (older but more widely available), then the default
+        resolved = _RESOLVED_LATEST if prefer_latest else _RESOLVED_DIRECT
+        return resolved.get(region, cls.DEFAULT_MODEL)
     
     @classmethod
     def get_config_for_region(cls, region: str) -> Dict[str, str]:
@@ -111,21 +117,16 @@ class BedrockModelConfig:
             "recommendations": []
         }
         
-        # Check for common issues
-        if model_id.startswith("us.") and not region.startswith("us-"):
-            result["warnings"].append(f"Using US inference profile in non-US region {region}")
-            result["recommendations"].append(f"Consider using regional profile: {cls.get_model_id(region)}")
-        
-        if model_id.startswith("jp.") and not region.startswith("ap-northeast-"):
-            result["warnings"].append(f"Using Japan inference profile in non-Japan region {region}")
-            result["recommendations"].append(f"Consider using regional profile: {cls.get_model_id(region)}")
-        
-        if model_id.startswith("au.") and not region.startswith("ap-southeast-"):
-            result["warnings"].append(f"Using Australia inference profile in non-Australia region {region}")
-            result["recommendations"].append(f"Consider using regional profile: {cls.get_model_id(region)}")
+        # Check for an inference profile used outside its geography
+        for prefix, region_prefix, geography in _PROFILE_REGIONS:
+            if model_id.startswith(prefix):
+                if not region.startswith(region_prefix):
+                    result["warnings"].append(f"Using {geography} inference profile in non-{geography} region {region}")
+                    result["recommendations"].append(f"Consider using regional profile: {cls.get_model_id(region)}")
+                break
         
         # Check for v2 models that require inference profiles
-        if "20241022-v2:0" in model_id and not any(model_id.startswith(prefix) for prefix in ["us.", "jp.", "au."]):
+        if "20241022-v2:0" in model_id and not model_id.startswith(_PROFILE_PREFIXES):
             result["valid"] = False
             result["warnings"].append("Claude 3.5 Sonnet v2 requires inference profile")
             result["recommendations"].append(f"Use inference profile: {cls.get_model_id(region)}")
@@ -133,9 +134,16 @@ class BedrockModelConfig:
         return result
 
 
+# Region -> model ID resolved once from the tables above
+_RESOLVED_DIRECT: Dict[str, str] = dict(BedrockModelConfig.DIRECT_MODELS)
+_RESOLVED_LATEST: Dict[str, str] = {**_RESOLVED_DIRECT, **BedrockModelConfig.REGIONAL_PROFILES}
+
+
+@lru_cache(maxsize=1)
 def get_bedrock_model_id() -> str:
     """
     Convenience function to get the appropriate Bedrock model ID for current environment.
+    The result is memoized, so AWS_REGION is read once per process.
     
     Returns:
         Model ID string configured for the current AWS region
@@ -1,29 +1,111 @@
 """Lightweight content processing service using OpenAI embeddings."""
 
+import asyncio
+import hashlib
 import logging
 import re
-import locale
-from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime
-from enum import Enum
+from collections import Counter
+from itertools import pairwise
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
-import openai
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from src.schemas.content import ContentAnalysis, ContentMetadata
 from src.config import settings
+from src.services.embedding_cache import EmbeddingCache
+from src.services.response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Analyses keyed by (language, blake2b of content); the same passages recur
+# across users, and each miss costs an embedding round-trip
+analysis_cache = ResponseCache(maxsize=256, ttl_seconds=3600)
+
+# Embeddings persisted across restarts, keyed by model and truncated input
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_EMBEDDING_BATCH_SIZE = 100  # Inputs per embeddings request
+embedding_cache = EmbeddingCache(settings.embedding_cache_path)
+
+# Japanese character-class patterns, compiled once
+_JA_SENTENCE_END_RE = re.compile(r'[。！？]')
+_KANJI_COMPOUND_RE = re.compile(r'[\u4e00-\u9faf]{2,}')
+_KATAKANA_WORD_RE = re.compile(r'[\u30a0-\u30ff]{2,}')
+_KANJI_KANA_KANJI_RE = re.compile(r'[\u4e00-\u9faf][\u3040-\u309f]{1,3}[\u4e00-\u9faf]')
+_LONG_KANJI_RE = re.compile(r'[\u4e00-\u9faf]{3,6}')
+
+# English tokenizers: runs of letters, and whitespace after terminal punctuation
+_WORD_RE = re.compile(r'[^\W\d_]+')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Accepted language identifiers mapped to their canonical key
+_LANGUAGE_KEYS = {
+    "english": "english",
+    "en": "english",
+    "en_us": "english",
+    "en_gb": "english",
+    "japanese": "japanese",
+    "ja": "japanese",
+    "ja_jp": "japanese",
+}
+
+# NLTK data used by the English path, as (resource path, package name)
+_NLTK_RESOURCES = (
+    ("corpora/stopwords", "stopwords"),
+)
+
+
+def _word_syllables(word: str) -> int:
+    """Estimate the syllables in a lowercase word from its vowel runs."""
+    word_syllables = 0
+    prev_was_vowel = False
+
+    for char in word:
+        if char in 'aeiouy':
+            if not prev_was_vowel:
+                word_syllables += 1
+            prev_was_vowel = True
+        else:
+            prev_was_vowel = False
+
+    # Handle silent 'e'
+    if word.endswith('e') and word_syllables > 1:
+        word_syllables -= 1
+
+    # Ensure at least 1 syllable per word
+    return max(word_syllables, 1)
 
-class SupportedLocale(Enum):
-    """Supported locales for content processing."""
-    ENGLISH_US = "en_US.UTF-8"
-    ENGLISH_GB = "en_GB.UTF-8"
-    JAPANESE = "ja_JP.UTF-8"
+
+def _initialize_nltk() -> FrozenSet[str]:
+    """Fetch missing NLTK data and return the English stopwords."""
+    try:
+        # Only hit the network for data that isn't installed yet
+        for resource, package in _NLTK_RESOURCES:
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                nltk.download(package, quiet=True)
+    except Exception as e:
+        logger.error(f"Failed to initialize NLTK: {e}")
+
+    try:
+        return frozenset(stopwords.words('english'))
+    except Exception as e:
+        logger.warning(f"Failed to load English stopwords: {e}")
+        return frozenset()
+
+
+# Stopword sets, built once per process
+_EN_STOPWORDS = _initialize_nltk()
+_JA_STOPWORDS = frozenset({
+    'の', 'に', 'は', 'を', 'た', 'が', 'で', 'て', 'と', 'し', 'れ', 'さ', 'ある', 'いる',
+    'も', 'する', 'から', 'な', 'こと', 'として', 'い', 'や', 'れる', 'など', 'なっ', 'ない',
+    'この', 'ため', 'その', 'あっ', 'よう', 'また', 'もの', 'という', 'あり', 'まで', 'られ',
+    'なる', 'へ', 'か', 'だ', 'これ', 'によって', 'により', 'おり', 'より', 'による', 'ず',
+    'なり', 'られる', 'において', 'ば', 'なかっ', 'なく', 'しかし', 'について', 'せ', 'だっ',
+    'その後', 'できる', 'それ'
+})
 
 
 class ContentProcessor:
@@ -31,109 +113,22 @@ class ContentProcessor:
 
     def __init__(self):
         """Initialize the content processor with OpenAI client."""
-        self._setup_locales()
-        self._initialize_nltk()
         self._initialize_openai()
 
-    def _setup_locales(self):
-        """Set up locale support for different languages."""
-        self.locale_mapping = {
-            "english": SupportedLocale.ENGLISH_US.value,
-            "en": SupportedLocale.ENGLISH_US.value,
-            "en_US": SupportedLocale.ENGLISH_US.value,
-            "en_GB": SupportedLocale.ENGLISH_GB.value,
-            "japanese": SupportedLocale.JAPANESE.value,
-            "ja": SupportedLocale.JAPANESE.value,
-            "ja_JP": SupportedLocale.JAPANESE.value
-        }
-
-        # Store current locale to restore later
-        self.original_locale = locale.getlocale()
-
-        # Test locale availability
-        self.available_locales = {}
-        for lang, loc in self.locale_mapping.items():
-            try:
-                locale.setlocale(locale.LC_ALL, loc)
-                self.available_locales[lang] = loc
-                logger.info(f"Locale {loc} available for {lang}")
-            except locale.Error:
-                logger.warning(
-                    f"Locale {loc} not available for {lang}, using fallback")
-                # Fallback to C locale
-                self.available_locales[lang] = "C"
-
-        # Restore original locale
-        try:
-            locale.setlocale(locale.LC_ALL, self.original_locale)
-        except (locale.Error, TypeError):
-            locale.setlocale(locale.LC_ALL, "C")
-
-    def _set_locale_for_language(self, language: str) -> str:
-        """Set appropriate locale for the given language."""
-        lang_key = language.lower()
-        target_locale = self.available_locales.get(lang_key, "C")
-
-        try:
-            current_locale = locale.setlocale(locale.LC_ALL, target_locale)
-            logger.debug(
-                f"Set locale to {current_locale} for language {language}")
-            return current_locale
-        except locale.Error as e:
-            logger.warning(f"Failed to set locale {target_locale}: {e}")
-            locale.setlocale(locale.LC_ALL, "C")
-            return "C"
-
-    def _restore_original_locale(self):
-        """Restore the original locale."""
-        try:
-            locale.setlocale(locale.LC_ALL, self.original_locale)
-        except (locale.Error, TypeError):
-            locale.setlocale(locale.LC_ALL, "C")
-
-    def _initialize_nltk(self):
-        """Initialize NLTK resources with locale support."""
-        try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            nltk.download('averaged_perceptron_tagger', quiet=True)
-
-            # Initialize stopwords for supported languages
-            self.stopwords = {}
-            try:
-                self.stopwords['english'] = set(stopwords.words('english'))
-                self.stopwords['en'] = self.stopwords['english']
-            except Exception as e:
-                logger.warning(f"Failed to load English stopwords: {e}")
-                self.stopwords['english'] = set()
-                self.stopwords['en'] = set()
-
-            # Japanese stopwords
-            self.stopwords['japanese'] = {
-                'の', 'に', 'は', 'を', 'た', 'が', 'で', 'て', 'と', 'し', 'れ', 'さ', 'ある', 'いる',
-                'も', 'する', 'から', 'な', 'こと', 'として', 'い', 'や', 'れる', 'など', 'なっ', 'ない',
-                'この', 'ため', 'その', 'あっ', 'よう', 'また', 'もの', 'という', 'あり', 'まで', 'られ',
-                'なる', 'へ', 'か', 'だ', 'これ', 'によって', 'により', 'おり', 'より', 'による', 'ず',
-                'なり', 'られる', 'において', 'ば', 'なかっ', 'なく', 'しかし', 'について', 'せ', 'だっ',
-                'その後', 'できる', 'それ'
-            }
-            self.stopwords['ja'] = self.stopwords['japanese']
-
-        except Exception as e:
-            logger.error(f"Failed to initialize NLTK: {e}")
-            self.stopwords = {'english': set(), 'en': set(),
-                              'japanese': set(), 'ja': set()}
-
     def _initialize_openai(self):
         """Initialize OpenAI client."""
         try:
             self.openai_client = OpenAI(api_key=settings.openai_api_key)
+            self.async_openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
             logger.info("OpenAI client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
             self.openai_client = None
+            self.async_openai_client = None
+        self._openai_sem = asyncio.Semaphore(settings.openai_max_concurrency)
 
-    def analyze_content(self, content: str, language: str, metadata: ContentMetadata, title: str = "Unknown") -> ContentAnalysis:
+    def analyze_content(self, content: str, language: str, metadata: ContentMetadata, title: str = "Unknown",
+                        embedding: Optional[List[float]] = None) -> ContentAnalysis:
         """
         Analyze content for topics, complexity, reading level, and generate embeddings.
 
@@ -142,51 +137,98 @@ class ContentProcessor:
             language: Language of the content ("english", "en", "japanese", "ja")
             metadata: Content metadata
             title: Title of the content for logging purposes
+            embedding: Precomputed embedding; generated via OpenAI when omitted
 
         Returns:
             ContentAnalysis object with analysis results
         """
-        # Normalize language identifier
-        lang_key = self._normalize_language_key(language)
-        logger.info(f"Analyzing {lang_key} content: {title[:50]}...")
+        # Normalize language identifier and hash the content
+        cache_key = self._analysis_cache_key(content, language)
+        lang_key = cache_key[0]
+        cached = analysis_cache.get(cache_key)
+        if cached is not None:
+            return ContentAnalysis.model_validate_json(cached)
 
-        # Set appropriate locale for processing
-        original_locale = self._set_locale_for_language(lang_key)
+        logger.info(f"Analyzing {lang_key} content: {title[:50]}...")
 
-        try:
-            if lang_key in ["english", "en"]:
-                result = self._analyze_english_content(content, metadata)
-            elif lang_key in ["japanese", "ja"]:
-                result = self._analyze_japanese_content(content, metadata)
-            else:
-                raise ValueError(f"Unsupported language: {language}")
-        finally:
-            # Always restore original locale
-            self._restore_original_locale()
+        if lang_key == "english":
+            result = self._analyze_english_content(content, metadata, embedding)
+        else:
+            result = self._analyze_japanese_content(content, metadata, embedding)
 
+        # Don't pin the zero-vector placeholder from a failed embedding call
+        if any(result.embedding):
+            analysis_cache.set(cache_key, result.model_dump_json().encode())
         return result
 
+    def analyze_content_batch(self, items: List[Tuple[str, str, ContentMetadata]]) -> List[ContentAnalysis]:
+        """
+        Analyze several documents, sharing embedding requests between them.
+
+        Args:
+            items: (content, language, metadata) tuples
+
+        Returns:
+            ContentAnalysis objects in the same order as ``items``
+        """
+        # Documents with a cached analysis don't need an embedding
+        pending = [
+            i for i, (content, language, _) in enumerate(items)
+            if analysis_cache.get(self._analysis_cache_key(content, language)) is None
+        ]
+        embeddings: List[Optional[List[float]]] = [None] * len(items)
+        batch = self._generate_openai_embeddings_batch([items[i][0] for i in pending])
+        for i, embedding in zip(pending, batch, strict=True):
+            embeddings[i] = embedding
+
+        return [
+            self.analyze_content(content, language, metadata, embedding=embedding)
+            for (content, language, metadata), embedding in zip(items, embeddings, strict=True)
+        ]
+
+    async def analyze_content_many(self, items: List[Tuple[str, str, ContentMetadata]]) -> List[ContentAnalysis]:
+        """
+        Analyze several documents with their embedding requests in flight concurrently.
+
+        Args:
+            items: (content, language, metadata) tuples
+
+        Returns:
+            ContentAnalysis objects in the same order as ``items``
+        """
+        async def analyze_one(content: str, language: str, metadata: ContentMetadata) -> ContentAnalysis:
+            embedding = None
+            if analysis_cache.get(self._analysis_cache_key(content, language)) is None:
+                embedding = await self._agenerate_openai_embedding(content)
+            return self.analyze_content(content, language, metadata, embedding=embedding)
+
+        return await asyncio.gather(*(analyze_one(*item) for item in items))
+
+    def _analysis_cache_key(self, content: str, language: str) -> Tuple[str, bytes]:
+        """Return the analysis cache key for ``content`` in ``language``."""
+        lang_key = self._normalize_language_key(language)
+        return (lang_key, hashlib.blake2b(content.encode(), digest_size=16).digest())
+
     def _normalize_language_key(self, language: str) -> str:
         """Normalize language identifier to supported format."""
-        lang_lower = language.lower()
-        if lang_lower in ["english", "en", "en_us", "en_gb"]:
-            return "english"
-        elif lang_lower in ["japanese", "ja", "ja_jp"]:
-            return "japanese"
-        else:
+        lang_key = _LANGUAGE_KEYS.get(language.lower())
+        if lang_key is None:
             raise ValueError(f"Unsupported language: {language}")
+        return lang_key
 
-    def _analyze_english_content(self, content: str, metadata: ContentMetadata) -> ContentAnalysis:
-        """Analyze English content using NLTK and simple heuristics."""
+    def _analyze_english_content(self, content: str, metadata: ContentMetadata,
+                                 embedding: Optional[List[float]] = None) -> ContentAnalysis:
+        """Analyze English content using regex tokenization and simple heuristics."""
         # Basic text statistics
-        sentences = sent_tokenize(content)
-        words = word_tokenize(content.lower())
-        word_count = len([w for w in words if w.isalpha()])
+        sentences = [s for s in _SENTENCE_SPLIT_RE.split(content.strip()) if s]
+        stats = self._english_stats(content)
+        words = stats["words"]
+        word_count = len(words)
         sentence_count = len(sentences)
 
         # Calculate readability metrics
         reading_level = self._calculate_english_readability(
-            content, word_count, sentence_count)
+            content, word_count, sentence_count, stats)
 
         # Extract topics and key phrases using simple methods
         topics = self._extract_english_topics_simple(content, words)
@@ -194,10 +236,11 @@ class ContentProcessor:
 
         # Calculate complexity metrics
         complexity = self._calculate_english_complexity(
-            content, words, sentences)
+            content, words, sentences, stats)
 
-        # Generate embedding using OpenAI
-        embedding = self._generate_openai_embedding(content)
+        # Generate embedding using OpenAI unless one was supplied
+        if embedding is None:
+            embedding = self._generate_openai_embedding(content)
 
         return ContentAnalysis(
             topics=topics,
@@ -207,7 +250,8 @@ class ContentProcessor:
             key_phrases=key_phrases
         )
 
-    def _analyze_japanese_content(self, content: str, metadata: ContentMetadata) -> ContentAnalysis:
+    def _analyze_japanese_content(self, content: str, metadata: ContentMetadata,
+                                  embedding: Optional[List[float]] = None) -> ContentAnalysis:
         """Analyze Japanese content using simple heuristics."""
         # Basic text statistics
         sentences = self._split_japanese_sentences(content)
@@ -226,8 +270,9 @@ class ContentProcessor:
         # Calculate complexity metrics
         complexity = self._calculate_japanese_complexity(content, sentences)
 
-        # Generate embedding using OpenAI
-        embedding = self._generate_openai_embedding(content)
+        # Generate embedding using OpenAI unless one was supplied
+        if embedding is None:
+            embedding = self._generate_openai_embedding(content)
 
         return ContentAnalysis(
             topics=topics,
@@ -237,22 +282,26 @@ class ContentProcessor:
             key_phrases=key_phrases
         )
 
-    def _calculate_english_readability(self, content: str, word_count: int, sentence_count: int) -> Dict:
+    def _calculate_english_readability(self, content: str, word_count: int, sentence_count: int,
+                                       stats: Optional[Dict] = None) -> Dict:
         """Calculate English readability metrics."""
         if sentence_count == 0 or word_count == 0:
             return {"flesch_kincaid": 0, "smog": 0, "coleman_liau": 0, "level": "beginner"}
 
+        if stats is None:
+            stats = self._english_stats(content)
+
         # Flesch-Kincaid Grade Level
-        syllable_count = self._count_syllables_english(content)
+        syllable_count = stats["syllables"]
         fk_grade = 0.39 * (word_count / sentence_count) + \
             11.8 * (syllable_count / word_count) - 15.59
 
         # SMOG Index (simplified)
-        complex_words = self._count_complex_words_english(content)
+        complex_words = stats["complex_words"]
         smog = 1.043 * ((complex_words * 30 / sentence_count) ** 0.5) + 3.1291
 
         # Coleman-Liau Index
-        letters = len([c for c in content if c.isalpha()])
+        letters = stats["letters"]
         coleman_liau = 0.0588 * (letters / word_count * 100) - \
             0.296 * (sentence_count / word_count * 100) - 15.8
 
@@ -314,17 +363,11 @@ class ContentProcessor:
         topics = []
 
         # Filter out stopwords and get word frequencies
-        stopwords_set = self.stopwords.get('english', set())
         content_words = [word for word in words if word.isalpha()
-                         and len(word) > 3 and word not in stopwords_set]
-
-        # Count word frequencies
-        word_freq = {}
-        for word in content_words:
-            word_freq[word] = word_freq.get(word, 0) + 1
+                         and len(word) > 3 and word not in _EN_STOPWORDS]
 
         # Get top words as topics
-        for word, count in sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10]:
+        for word, count in Counter(content_words).most_common(10):
             confidence = min(count / len(content_words), 1.0)
             if confidence > 0.01:  # Only include words that appear meaningfully
                 topics.append({
@@ -340,17 +383,15 @@ class ContentProcessor:
         topics = []
 
         # Extract potential compound words (sequences of kanji/katakana)
-        kanji_words = re.findall(r'[\u4e00-\u9faf]{2,}', content)
-        katakana_words = re.findall(r'[\u30a0-\u30ff]{2,}', content)
+        kanji_words = _KANJI_COMPOUND_RE.findall(content)
+        katakana_words = _KATAKANA_WORD_RE.findall(content)
 
-        # Count frequencies
-        word_freq = {}
-        for word in kanji_words + katakana_words:
-            if len(word) >= 2:
-                word_freq[word] = word_freq.get(word, 0) + 1
+        # Both patterns already require two or more characters
+        word_freq = Counter(kanji_words)
+        word_freq.update(katakana_words)
 
         # Get top words as topics
-        for word, count in sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10]:
+        for word, count in word_freq.most_common(10):
             confidence = min(count / 10, 1.0)
             topics.append({
                 "topic": word,
@@ -363,20 +404,16 @@ class ContentProcessor:
     def _extract_english_key_phrases_simple(self, content: str, words: List[str]) -> List[str]:
         """Extract key phrases using simple bigram analysis."""
         key_phrases = []
-        stopwords_set = self.stopwords.get("english", set())
 
         # Filter meaningful words
         meaningful_words = [w for w in words if w.isalpha()
-                            and len(w) > 2 and w not in stopwords_set]
+                            and len(w) > 2 and w not in _EN_STOPWORDS]
 
         # Extract bigrams
-        bigrams = {}
-        for i in range(len(meaningful_words) - 1):
-            bigram = f"{meaningful_words[i]} {meaningful_words[i+1]}"
-            bigrams[bigram] = bigrams.get(bigram, 0) + 1
+        bigrams = Counter(map(" ".join, pairwise(meaningful_words)))
 
         # Get top bigrams
-        for phrase, count in sorted(bigrams.items(), key=lambda x: x[1], reverse=True)[:10]:
+        for phrase, count in bigrams.most_common(10):
             if count > 1:  # Only phrases that appear multiple times
                 key_phrases.append(phrase.title())
 
@@ -387,11 +424,10 @@ class ContentProcessor:
         key_phrases = []
 
         # Extract sequences of kanji + hiragana (common phrase pattern)
-        phrases = re.findall(
-            r'[\u4e00-\u9faf][\u3040-\u309f]{1,3}[\u4e00-\u9faf]', content)
+        phrases = _KANJI_KANA_KANJI_RE.findall(content)
 
         # Extract longer kanji sequences
-        long_phrases = re.findall(r'[\u4e00-\u9faf]{3,6}', content)
+        long_phrases = _LONG_KANJI_RE.findall(content)
 
         # Combine and deduplicate
         all_phrases = list(set(phrases + long_phrases))
@@ -403,18 +439,23 @@ class ContentProcessor:
 
     def _generate_openai_embedding(self, content: str) -> List[float]:
         """Generate embedding using OpenAI's text-embedding-3-small model."""
+        # Truncate content to stay within token limits (~8000 tokens max)
+        truncated_content = content[:6000] if len(
+            content) > 6000 else content
+
+        cache_key = embedding_cache.key(_EMBEDDING_MODEL, truncated_content)
+        cached = embedding_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if not self.openai_client:
             logger.warning(
                 "OpenAI client not available, returning zero vector")
             return [0.0] * 1536  # text-embedding-3-small dimension
 
         try:
-            # Truncate content to stay within token limits (~8000 tokens max)
-            truncated_content = content[:6000] if len(
-                content) > 6000 else content
-
             response = self.openai_client.embeddings.create(
-                model="text-embedding-3-small",
+                model=_EMBEDDING_MODEL,
                 input=truncated_content,
                 encoding_format="float"
             )
@@ -422,29 +463,90 @@ class ContentProcessor:
             embedding = response.data[0].embedding
             logger.debug(
                 f"Generated OpenAI embedding with {len(embedding)} dimensions")
+            embedding_cache.set(cache_key, embedding)
+            return embedding
+
+        except Exception as e:
+            logger.error(f"Failed to generate OpenAI embedding: {e}")
+            return [0.0] * 1536
+
+    async def _agenerate_openai_embedding(self, content: str) -> List[float]:
+        """Generate an embedding without blocking the event loop."""
+        truncated_content = content[:6000]
+
+        cache_key = embedding_cache.key(_EMBEDDING_MODEL, truncated_content)
+        cached = embedding_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if not self.async_openai_client:
+            logger.warning(
+                "OpenAI client not available, returning zero vector")
+            return [0.0] * 1536
+
+        try:
+            # The client retries 429s and 5xx itself, honoring Retry-After
+            async with self._openai_sem:
+                response = await self.async_openai_client.embeddings.create(
+                    model=_EMBEDDING_MODEL,
+                    input=truncated_content,
+                    encoding_format="float"
+                )
+
+            embedding = response.data[0].embedding
+            embedding_cache.set(cache_key, embedding)
             return embedding
 
         except Exception as e:
             logger.error(f"Failed to generate OpenAI embedding: {e}")
             return [0.0] * 1536
 
-    def _calculate_english_complexity(self, content: str, words: List[str], sentences: List[str]) -> Dict:
+    def _generate_openai_embeddings_batch(self, contents: List[str]) -> List[List[float]]:
+        """Generate embeddings for many texts, up to 100 inputs per request."""
+        truncated = [content[:6000] for content in contents]
+        keys = [embedding_cache.key(_EMBEDDING_MODEL, text) for text in truncated]
+        embeddings = [embedding_cache.get(key) for key in keys]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        if missing and not self.openai_client:
+            logger.warning(
+                "OpenAI client not available, returning zero vectors")
+            missing = []
+
+        for start in range(0, len(missing), _EMBEDDING_BATCH_SIZE):
+            chunk = missing[start:start + _EMBEDDING_BATCH_SIZE]
+            try:
+                response = self.openai_client.embeddings.create(
+                    model=_EMBEDDING_MODEL,
+                    input=[truncated[i] for i in chunk],
+                    encoding_format="float"
+                )
+                for item in response.data:
+                    embeddings[chunk[item.index]] = item.embedding
+                    embedding_cache.set(keys[chunk[item.index]], item.embedding)
+            except Exception as e:
+                logger.error(f"Failed to generate OpenAI embeddings batch: {e}")
+
+        return [embedding if embedding is not None else [0.0] * 1536
+                for embedding in embeddings]
+
+    def _calculate_english_complexity(self, content: str, words: List[str], sentences: List[str],
+                                      stats: Optional[Dict] = None) -> Dict:
         """Calculate complexity metrics for English content."""
         if not words or not sentences:
             return {"lexical_diversity": 0, "avg_word_length": 0, "complex_word_ratio": 0}
 
+        if stats is None:
+            stats = self._english_stats(content)
+
         # Lexical diversity (Type-Token Ratio)
-        unique_words = set(words)
-        lexical_diversity = len(unique_words) / len(words)
+        lexical_diversity = stats["unique_words"] / len(words)
 
         # Average word length
-        alpha_words = [w for w in words if w.isalpha()]
-        avg_word_length = sum(len(w)
-                              for w in alpha_words) / max(len(alpha_words), 1)
+        avg_word_length = stats["letters"] / len(words)
 
         # Complex word ratio (words with 3+ syllables)
-        complex_words = self._count_complex_words_english(content)
-        complex_word_ratio = complex_words / max(len(alpha_words), 1)
+        complex_word_ratio = stats["complex_words"] / len(words)
 
         return {
             "lexical_diversity": round(lexical_diversity, 3),
@@ -478,51 +580,40 @@ class ContentProcessor:
             "punctuation_density": round(punctuation_density, 3)
         }
 
-    def _count_syllables_english(self, text: str) -> int:
-        """Count syllables in English text (simplified approach)."""
-        words = word_tokenize(text.lower())
-        syllable_count = 0
-
-        for word in words:
-            if word.isalpha():
-                # Simple syllable counting heuristic
-                vowels = 'aeiouy'
-                word_syllables = 0
-                prev_was_vowel = False
+    def _english_stats(self, text: str) -> Dict:
+        """Tokenize English text once and tally the counts the metrics need."""
+        words = []
+        letters = syllables = complex_words = 0
 
-                for char in word:
-                    if char in vowels:
-                        if not prev_was_vowel:
-                            word_syllables += 1
-                        prev_was_vowel = True
-                    else:
-                        prev_was_vowel = False
+        for match in _WORD_RE.finditer(text.lower()):
+            word = match.group()
+            words.append(word)
+            letters += len(word)
+            syllables += _word_syllables(word)
+            if len(word) > 6:  # Simplified: assume longer words are complex
+                complex_words += 1
 
-                # Handle silent 'e'
-                if word.endswith('e') and word_syllables > 1:
-                    word_syllables -= 1
-
-                # Ensure at least 1 syllable per word
-                syllable_count += max(word_syllables, 1)
+        return {
+            "words": words,
+            "unique_words": len(set(words)),
+            "letters": letters,
+            "syllables": syllables,
+            "complex_words": complex_words
+        }
 
-        return syllable_count
+    def _count_syllables_english(self, text: str) -> int:
+        """Count syllables in English text (simplified approach)."""
+        return self._english_stats(text)["syllables"]
 
     def _count_complex_words_english(self, text: str) -> int:
         """Count complex words (3+ syllables) in English text."""
-        words = word_tokenize(text.lower())
-        complex_count = 0
-
-        for word in words:
-            if word.isalpha() and len(word) > 6:  # Simplified: assume longer words are complex
-                complex_count += 1
-
-        return complex_count
+        return self._english_stats(text)["complex_words"]
 
     def _split_japanese_sentences(self, text: str) -> List[str]:
         """Split Japanese text into sentences."""
         # Simple sentence splitting based on Japanese punctuation
-        sentences = re.split(r'[。！？]', text)
-        return [s.strip() for s in sentences if s.strip()]
+        sentences = map(str.strip, _JA_SENTENCE_END_RE.split(text))
+        return [s for s in sentences if s]
 
 
 # Global instance
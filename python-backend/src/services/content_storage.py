@@ -7,7 +7,7 @@ from datetime import datetime
 from contextlib import asynccontextmanager
 
 from pinecone import Pinecone
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from sqlalchemy import and_, or_, func, desc
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -16,7 +16,7 @@ from src.models.user_profile import UserProfile, ReadingBehavior
 from src.schemas.content import (
     ContentItemCreate, ContentItemResponse, ContentAnalysis,
     ContentMetadata, SavedContentRequest, SavedContentResponse,
-    ContentSearchRequest, ContentSearchResponse
+    ContentSearchRequest, ContentSearchResponse, SearchResultsAdapter
 )
 from src.services.content_processor import content_processor
 from src.services.database import db_service
@@ -246,7 +246,9 @@ class ContentStorageService:
             content_ids = [match.id for match in search_results.matches]
 
             with db_service.get_session() as session:
-                content_items = session.query(ContentItem).filter(
+                content_items = session.query(ContentItem).options(
+                    undefer(ContentItem.content)
+                ).filter(
                     ContentItem.id.in_(content_ids)
                 ).all()
 
@@ -258,14 +260,15 @@ class ContentStorageService:
                     )
                     if content_item:
                         results.append({
-                            "content": ContentItemResponse.from_orm(content_item),
+                            "content": content_item,
                             "similarity_score": match.score,
                             "match_metadata": match.metadata
                         })
 
                 return ContentSearchResponse(
                     query_text=request.query_text,
-                    results=results,
+                    results=SearchResultsAdapter.validate_python(
+                        results, from_attributes=True),
                     total_results=len(results),
                     search_method="vector_similarity"
                 )
@@ -356,7 +359,9 @@ class ContentStorageService:
         try:
             with db_service.get_session() as session:
                 # Build query for content matching topics and criteria
-                query = session.query(ContentItem).filter(
+                query = session.query(ContentItem).options(
+                    undefer(ContentItem.content)
+                ).filter(
                     and_(
                         ContentItem.language == language,
                         ContentItem.analysis.op(
@@ -397,7 +402,9 @@ class ContentStorageService:
 
         try:
             with db_service.get_session() as session:
-                content_item = session.get(ContentItem, content_id)
+                content_item = session.get(
+                    ContentItem, content_id,
+                    options=[undefer(ContentItem.content)])
                 if not content_item:
                     raise ValueError(f"Content {content_id} not found")
 
@@ -495,7 +502,8 @@ class ContentStorageService:
 
         try:
             with db_service.get_session() as session:
-                query = session.query(ContentItem)
+                query = session.query(ContentItem).options(
+                    undefer(ContentItem.content))
 
                 # Apply filters
                 if request.language:
@@ -519,14 +527,17 @@ class ContentStorageService:
 
                 content_items = query.limit(request.limit).all()
 
-                results = [
-                    {
-                        "content": ContentItemResponse.from_orm(item),
-                        "similarity_score": 0.5,  # Default score for text search
-                        "match_metadata": {"search_method": "text_based"}
-                    }
-                    for item in content_items
-                ]
+                results = SearchResultsAdapter.validate_python(
+                    [
+                        {
+                            "content": item,
+                            "similarity_score": 0.5,  # Default score for text search
+                            "match_metadata": {"search_method": "text_based"}
+                        }
+                        for item in content_items
+                    ],
+                    from_attributes=True
+                )
 
                 return ContentSearchResponse(
                     query_text=request.query_text,
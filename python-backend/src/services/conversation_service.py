@@ -5,11 +5,11 @@ import logging
 import asyncio
 from typing import Dict, List, Optional, Any, AsyncGenerator
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 
 from src.models.conversation import ConversationSession, ConversationMessage
 from src.models.user_profile import UserProfile
-from src.services.agent_core import AgentCoreService
+from src.services.agent_core import agent_core_service
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +18,7 @@ class ConversationService:
     """Service for processing conversations with NLU capabilities."""
 
     def __init__(self):
-        self.agent_core = AgentCoreService()
+        self.agent_core = agent_core_service
 
     async def process_user_message(
         self,
@@ -32,11 +32,10 @@ class ConversationService:
             session = await self._get_or_create_session(session_id, db)
 
             # Analyze user intent and extract entities
-            intent = await self.agent_core.analyze_intent(
+            intent, entities = await self.agent_core.analyze(
                 user_message,
                 session.context
             )
-            entities = await self.agent_core.extract_entities(user_message)
 
             # Store user message
             user_msg = await self._store_message(
@@ -460,9 +459,12 @@ class ConversationService:
         db: Session = None
     ) -> List[Dict]:
         """Get conversation history for a session."""
-        messages = db.query(ConversationMessage).filter(
+        messages = db.query(ConversationMessage).options(
+            undefer(ConversationMessage.content),
+            undefer(ConversationMessage.recommendations)
+        ).filter(
             ConversationMessage.session_id == session_id
-        ).order_by(ConversationMessage.timestamp.asc()).limit(limit).all()
+        ).order_by(ConversationMessage.timestamp.desc()).limit(limit).all()
 
         return [
             {
@@ -475,5 +477,5 @@ class ConversationService:
                     "recommendations": msg.recommendations
                 }
             }
-            for msg in messages
+            for msg in reversed(messages)  # Reverse to get chronological order
         ]
@@ -7,7 +7,7 @@ from contextlib import contextmanager
 import logging
 
 from src.database import SessionLocal, get_db
-from src.services.agent_core import AgentCoreService
+from src.services.agent_core import agent_core_service
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +20,7 @@ class DatabaseService:
 
     def __init__(self):
         """Initialize database service."""
-        self.agent_core = AgentCoreService()
+        self.agent_core = agent_core_service
 
     @contextmanager
     def get_session(self):
@@ -147,8 +147,8 @@ class DatabaseService:
 
             profile = self.create_record(db, UserProfile, **profile_data)
 
-            # Initialize with Agent Core
-            await self.agent_core.update_conversation_context(
+            # Initialize with Agent Core in the background
+            self.agent_core.enqueue_context_update(
                 session_id=f"profile_init_{user_id}",
                 user_message="Profile created",
                 agent_response="Welcome to Noah!",
@@ -174,11 +174,8 @@ class DatabaseService:
         from src.models.conversation import ConversationMessage
 
         try:
-            # Analyze intent with Agent Core
-            intent = await self.agent_core.analyze_intent(message, context)
-
-            # Extract entities
-            entities = await self.agent_core.extract_entities(message)
+            # Analyze intent and extract entities with Agent Core
+            intent, entities = await self.agent_core.analyze(message, context)
 
             # Store user message
             user_message = self.create_record(
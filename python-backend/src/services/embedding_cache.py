@@ -0,0 +1,67 @@
+"""SQLite-backed cache for embedding vectors."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Persistent content-addressed store of embeddings.
+
+    Vectors are keyed by the SHA-256 of the model name and input text and
+    stored as float32 bytes. Each thread gets its own connection; WAL mode
+    lets readers proceed while another thread writes. An empty ``path``
+    disables the cache.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the cache."""
+        self.path = path
+        self._local = threading.local()
+
+    @staticmethod
+    def key(model: str, text: str) -> bytes:
+        """Return the cache key for ``text`` embedded with ``model``."""
+        return hashlib.sha256(f"{model}\0{text}".encode()).digest()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS emb (k BLOB PRIMARY KEY, v BLOB)")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: bytes) -> Optional[List[float]]:
+        """Return the stored embedding for ``key``, or None."""
+        if not self.path:
+            return None
+        try:
+            row = self._connection().execute(
+                "SELECT v FROM emb WHERE k = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32).tolist()
+
+    def set(self, key: bytes, embedding: List[float]) -> None:
+        """Store ``embedding`` under ``key``."""
+        if not self.path:
+            return
+        value = np.asarray(embedding, dtype=np.float32).tobytes()
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute("INSERT OR IGNORE INTO emb (k, v) VALUES (?, ?)", (key, value))
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache write failed: {e}")
@@ -5,13 +5,13 @@ import logging
 import asyncio
 from typing import Dict, List, Optional, Any, AsyncGenerator
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 
 from src.models.conversation import ConversationSession, ConversationMessage
 from src.models.user_profile import UserProfile
-from src.services.agent_core import AgentCoreService
+from src.services.agent_core import agent_core_service
 from src.services.strands_agent_service import StrandsAgentService
-from src.services.ai_response_service import AIResponseService
+from src.services.ai_response_service import ai_response_service
 from src.services.strands_config import strands_config
 from src.config import settings
 
@@ -22,8 +22,8 @@ class EnhancedConversationService:
     """Enhanced conversation service using Strands agents with HTTP streaming."""
 
     def __init__(self):
-        self.agent_core = AgentCoreService()
-        self.ai_response_service = AIResponseService()
+        self.agent_core = agent_core_service
+        self.ai_response_service = ai_response_service
         
         # Initialize Strands agent service if enabled
         self.strands_service = None
@@ -1071,7 +1071,10 @@ class EnhancedConversationService:
         db: Session = None
     ) -> List[Dict]:
         """Get conversation history for a session."""
-        messages = db.query(ConversationMessage).filter(
+        messages = db.query(ConversationMessage).options(
+            undefer(ConversationMessage.content),
+            undefer(ConversationMessage.recommendations)
+        ).filter(
             ConversationMessage.session_id == session_id
         ).order_by(ConversationMessage.timestamp.desc()).limit(limit).all()
 
@@ -1181,7 +1184,9 @@ class EnhancedConversationService:
         limit: int = 10
     ) -> List[Dict]:
         """Get recent conversation history for context."""
-        messages = db.query(ConversationMessage).filter(
+        messages = db.query(ConversationMessage).options(
+            undefer(ConversationMessage.content)
+        ).filter(
             ConversationMessage.session_id == session_id
         ).order_by(ConversationMessage.timestamp.desc()).limit(limit).all()
 
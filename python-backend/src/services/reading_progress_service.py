@@ -6,7 +6,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 from collections import defaultdict
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, desc, func, update, cast, literal, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 
 from src.models.user_profile import UserProfile, ReadingBehavior, PreferenceSnapshot
 from src.models.content import ContentItem
@@ -100,14 +101,9 @@ class ReadingProgressTracker:
             behavior.user_id, performance_indicators, db
         )
 
-        # Update the behavior record
-        behavior.pause_patterns = updated_metrics.get("pause_patterns", [])
-        behavior.interactions = updated_metrics.get("interactions", [])
-        behavior.reading_speed = updated_metrics.get(
-            "current_reading_speed", 0.0)
-        behavior.completion_rate = progress_data.get("completion_rate", 0.0)
-
-        db.commit()
+        # Update the behavior record in a single statement
+        self._persist_progress_update(
+            behavior, progress_data, updated_metrics, db)
 
         return {
             "session_id": session_id,
@@ -326,12 +322,56 @@ class ReadingProgressTracker:
             }
         }
 
+    def _persist_progress_update(self, behavior: ReadingBehavior, progress_data: Dict,
+                                 updated_metrics: Dict, db: Session) -> None:
+        """
+        Write a progress event to the behavior row with one UPDATE.
+
+        On PostgreSQL new pause/interaction events are appended server-side
+        with jsonb concatenation, so concurrent events for the same session
+        don't overwrite each other. Other dialects get the full lists.
+        """
+        values = {
+            "completion_rate": progress_data.get("completion_rate", 0.0),
+            "reading_speed": updated_metrics.get("current_reading_speed", 0.0)
+        }
+
+        new_events = {
+            "pause_patterns": progress_data.get("pause_event"),
+            "interactions": progress_data.get("interaction_event")
+        }
+        append_in_db = db.get_bind().dialect.name == "postgresql"
+
+        for column_name, event in new_events.items():
+            if event is None:
+                continue
+            if append_in_db:
+                column = getattr(ReadingBehavior, column_name)
+                existing = cast(func.coalesce(column, cast(literal("[]"), JSON)), JSONB)
+                appended = existing.op("||")(cast(literal([event], JSON), JSONB))
+                values[column_name] = cast(appended, JSON)
+            else:
+                values[column_name] = updated_metrics.get(column_name, [])
+
+        db.execute(
+            update(ReadingBehavior)
+            .where(and_(
+                ReadingBehavior.id == behavior.id,
+                # Partition key, so only one partition is touched
+                ReadingBehavior.start_time == behavior.start_time
+            ))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
     def _update_behavioral_metrics(self, behavior: ReadingBehavior,
                                    progress_data: Dict) -> Dict:
         """Update behavioral metrics with new progress data."""
+        # Copy so the ORM-loaded lists are never mutated in place
         current_metrics = {
-            "pause_patterns": behavior.pause_patterns or [],
-            "interactions": behavior.interactions or [],
+            "pause_patterns": list(behavior.pause_patterns or []),
+            "interactions": list(behavior.interactions or []),
             "engagement_metrics": {}
         }
 
@@ -93,11 +93,16 @@ class ContextualRecommendationEngine:
                     f"No candidate content found for user {user_id}")
                 return []
 
+            # Interest scores for all candidates in one vectorized pass
+            interest_scores = self._batch_interest_scores(
+                candidates, preferences)
+
             # Score candidates based on multiple factors
             scored_recommendations = []
-            for content in candidates:
+            for content, interest_score in zip(candidates, interest_scores, strict=True):
                 score_data = await self._calculate_recommendation_score(
-                    content, preferences, reading_levels, context, user_id, db
+                    content, preferences, reading_levels, context, user_id, db,
+                    interest_score=float(interest_score)
                 )
 
                 if score_data["total_score"] > 0.1:  # Minimum threshold
@@ -212,14 +217,14 @@ class ContextualRecommendationEngine:
         reading_levels: LanguageReadingLevels,
         context: ReadingContext,
         user_id: str,
-        db: Session
+        db: Session,
+        interest_score: Optional[float] = None
     ) -> Dict:
         """Calculate comprehensive recommendation score for content."""
         analysis = ContentAnalysis(
             **content.analysis) if content.analysis else None
 
         # Initialize score components
-        interest_score = 0.0
         reading_level_score = 0.0
         contextual_score = 0.0
 
@@ -228,23 +233,12 @@ class ContextualRecommendationEngine:
 
         # 1. Calculate interest score based on topic preferences
         if analysis and analysis.topics:
-            topic_scores = []
-            for topic_data in analysis.topics:
-                topic = topic_data.get("topic", "")
-                topic_confidence = topic_data.get("confidence", 0.5)
-
-                # Find matching user preference
-                user_topic_weight = 0.0
-                for pref_topic in preferences.topics:
-                    if pref_topic.get("topic") == topic:
-                        user_topic_weight = pref_topic.get("weight", 0.0)
-                        break
-
-                topic_score = user_topic_weight * topic_confidence
-                topic_scores.append(topic_score)
-
-            interest_score = np.mean(topic_scores) if topic_scores else 0.0
+            if interest_score is None:
+                interest_score = float(
+                    self._batch_interest_scores([content], preferences)[0])
             score_breakdown["interest"] = interest_score
+        else:
+            interest_score = 0.0
 
         # 2. Calculate reading level appropriateness score
         reading_level_score = await self._calculate_reading_level_score(
@@ -287,6 +281,48 @@ class ContextualRecommendationEngine:
             "explanation": explanation
         }
 
+    def _batch_interest_scores(
+        self,
+        candidates: List[ContentItem],
+        preferences: PreferenceModel
+    ) -> np.ndarray:
+        """
+        Calculate topic interest scores for many candidates at once.
+
+        Each candidate's score is the mean of ``user_weight * confidence``
+        over its topics. Topic pairs are flattened into arrays and reduced
+        per candidate with ``np.bincount`` instead of nested Python loops.
+        """
+        # First matching preference wins, as with a linear scan
+        topic_weights: Dict[str, float] = {}
+        for pref_topic in preferences.topics:
+            topic_weights.setdefault(
+                pref_topic.get("topic"), pref_topic.get("weight", 0.0))
+
+        owners: List[int] = []
+        weights: List[float] = []
+        confidences: List[float] = []
+        for index, content in enumerate(candidates):
+            topics = (content.analysis or {}).get("topics") or []
+            for topic_data in topics:
+                owners.append(index)
+                weights.append(
+                    topic_weights.get(topic_data.get("topic", ""), 0.0))
+                confidences.append(topic_data.get("confidence", 0.5))
+
+        n_candidates = len(candidates)
+        if not owners:
+            return np.zeros(n_candidates)
+
+        owner_idx = np.asarray(owners, dtype=np.intp)
+        products = np.asarray(weights, dtype=np.float64) * \
+            np.asarray(confidences, dtype=np.float64)
+        sums = np.bincount(owner_idx, weights=products, minlength=n_candidates)
+        counts = np.bincount(owner_idx, minlength=n_candidates)
+
+        return np.divide(
+            sums, counts, out=np.zeros(n_candidates), where=counts > 0)
+
     async def _calculate_reading_level_score(
         self,
         content: ContentItem,
@@ -0,0 +1,75 @@
+"""In-process TTL caches for read-heavy API responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from sqlalchemy import event
+
+from src.models.content import ContentItem
+from src.models.user_profile import UserProfile
+
+
+class ResponseCache:
+    """Bounded TTL cache mapping keys to pre-serialized JSON bytes."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return the cached payload for ``key`` if present and not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, payload = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, key: Hashable, payload: bytes) -> None:
+        """Store ``payload`` for ``key``, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop ``key`` from the cache."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Content items are effectively immutable after ingestion; profiles change
+# as preferences evolve, so they get a shorter TTL.
+content_response_cache = ResponseCache(maxsize=10_000, ttl_seconds=300)
+user_profile_response_cache = ResponseCache(maxsize=10_000, ttl_seconds=60)
+
+
+@event.listens_for(ContentItem, "after_update")
+@event.listens_for(ContentItem, "after_delete")
+def _invalidate_content_item(mapper, connection, target: ContentItem) -> None:
+    """Invalidate cached content responses when the row changes."""
+    content_response_cache.invalidate(target.id)
+
+
+@event.listens_for(UserProfile, "after_update")
+@event.listens_for(UserProfile, "after_delete")
+def _invalidate_user_profile(mapper, connection, target: UserProfile) -> None:
+    """Invalidate cached profile responses when the row changes."""
+    user_profile_response_cache.invalidate(target.user_id)
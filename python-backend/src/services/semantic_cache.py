@@ -0,0 +1,105 @@
+"""Embedding-based cache for AI completions."""
+
+from typing import Dict, Hashable, List, Optional
+
+import numpy as np
+
+
+class SemanticResponseCache:
+    """Fixed-capacity cache returning responses for near-duplicate prompts.
+
+    Embeddings are stored L2-normalized in a float32 matrix so a lookup is a
+    single matrix-vector product. Entries only match within the same
+    partition key, which callers use for everything that must match exactly,
+    and the least recently used entry is replaced once the cache is full.
+    A partition's id is dropped once no slot holds an entry for it.
+    """
+
+    def __init__(self, capacity: int = 1024, threshold: float = 0.92):
+        """Initialize the cache."""
+        self.capacity = capacity
+        self.threshold = threshold
+        self._embeddings: Optional[np.ndarray] = None
+        self._key_ids = np.full(capacity, -1, dtype=np.int64)
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._responses: List[Optional[str]] = [None] * capacity
+        self._partitions: List[Optional[Hashable]] = [None] * capacity
+        # Partition -> id used in _key_ids, and how many slots hold it
+        self._key_index: Dict[Hashable, int] = {}
+        self._key_slots: Dict[Hashable, int] = {}
+        self._next_key_id = 0
+        self._size = 0
+        self._tick = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return self._size
+
+    @staticmethod
+    def normalize(embedding) -> np.ndarray:
+        """Return ``embedding`` as an L2-normalized float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, embedding: np.ndarray, partition: Hashable) -> Optional[str]:
+        """Return the cached response in ``partition`` most similar to ``embedding``, if close enough."""
+        key_id = self._key_index.get(partition)
+        if key_id is None or self._size == 0:
+            return None
+
+        sims = self._embeddings[:self._size] @ embedding
+        sims[self._key_ids[:self._size] != key_id] = -1.0
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            return None
+
+        self._tick += 1
+        self._last_used[best] = self._tick
+        return self._responses[best]
+
+    def add(self, embedding: np.ndarray, partition: Hashable, response: str) -> None:
+        """Store ``response`` for ``embedding``, evicting the least recently used entry."""
+        if self._embeddings is None:
+            self._embeddings = np.zeros((self.capacity, embedding.shape[0]), dtype=np.float32)
+
+        if self._size < self.capacity:
+            slot = self._size
+            self._size += 1
+        else:
+            slot = int(np.argmin(self._last_used))
+            self._release(self._partitions[slot])
+
+        key_id = self._key_index.get(partition)
+        if key_id is None:
+            key_id = self._key_index[partition] = self._next_key_id
+            self._next_key_id += 1
+        self._key_slots[partition] = self._key_slots.get(partition, 0) + 1
+
+        self._tick += 1
+        self._embeddings[slot] = embedding
+        self._key_ids[slot] = key_id
+        self._last_used[slot] = self._tick
+        self._responses[slot] = response
+        self._partitions[slot] = partition
+
+    def _release(self, partition: Hashable) -> None:
+        """Forget ``partition`` once its last slot has been evicted."""
+        remaining = self._key_slots[partition] - 1
+        if remaining:
+            self._key_slots[partition] = remaining
+        else:
+            del self._key_slots[partition]
+            del self._key_index[partition]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._key_ids.fill(-1)
+        self._last_used.fill(0)
+        self._responses = [None] * self.capacity
+        self._partitions = [None] * self.capacity
+        self._key_index.clear()
+        self._key_slots.clear()
+        self._next_key_id = 0
+        self._size = 0
+        self._tick = 0
@@ -7,6 +7,10 @@ from sqlalchemy.orm import sessionmaker
 
 from src.main import app
 from src.database import get_db, Base
+from src.services.response_cache import (
+    content_response_cache,
+    user_profile_response_cache
+)
 
 
 # Test database URL (use SQLite for testing)
@@ -40,6 +44,8 @@ def client():
 
     Base.metadata.drop_all(bind=engine)
     app.dependency_overrides.clear()
+    content_response_cache.clear()
+    user_profile_response_cache.clear()
 
 
 @pytest.fixture
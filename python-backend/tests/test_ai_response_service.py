@@ -0,0 +1,404 @@
+"""Tests for AI response service."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.ai_response_service import (
+    AIResponseService,
+    prompt_cache,
+    semantic_cache,
+    template_cache,
+)
+
+
+@pytest.fixture
+def fallback_service():
+    """Create an AI response service without an OpenAI client."""
+    service = AIResponseService()
+    service.openai_client = None
+    service.has_ai = False
+    service.preferred_provider = service._determine_preferred_provider()
+    return service
+
+
+def _completion(text):
+    """Build a chat completion response whose message content is ``text``."""
+    message = SimpleNamespace(content=text)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _stream_chunk(text):
+    """Build a streamed completion chunk whose delta content is ``text``."""
+    delta = SimpleNamespace(content=text)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def _embedding(vector):
+    """Build an embeddings response holding a single ``vector``."""
+    return SimpleNamespace(data=[SimpleNamespace(embedding=vector)])
+
+
+def _fake_client(create, embed=None):
+    """Build a stand-in OpenAI client from fake ``create`` and ``embed`` calls."""
+    client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    if embed is not None:
+        client.embeddings = SimpleNamespace(create=embed)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_fallback_streaming_yields_whole_response(fallback_service, monkeypatch):
+    """Test fallback streaming returns the response without a typing delay."""
+    async def fail_sleep(delay):
+        raise AssertionError("fallback streaming should not sleep")
+
+    monkeypatch.setattr("src.services.ai_response_service.asyncio.sleep", fail_sleep)
+
+    intent = {"intent": "book_recommendation"}
+    chunks = [
+        chunk async for chunk in fallback_service.generate_streaming_response(
+            "Recommend a book", intent, {"preferred_language": "english"})
+    ]
+
+    assert chunks == [
+        fallback_service._generate_fallback_response("Recommend a book", intent)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_simulated_fallback_streaming_yields_fixed_chunks(fallback_service, monkeypatch):
+    """Test simulated fallback streaming yields 64-character slices."""
+    sleeps = []
+
+    async def record_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("src.services.ai_response_service.asyncio.sleep", record_sleep)
+    monkeypatch.setattr(
+        "src.services.ai_response_service.settings.simulate_streaming_delay", 0.01)
+
+    intent = {"intent": "book_recommendation"}
+    chunks = [
+        chunk async for chunk in fallback_service.generate_streaming_response(
+            "Recommend a book", intent, {"preferred_language": "english"})
+    ]
+
+    assert "".join(chunks) == fallback_service._generate_fallback_response(
+        "Recommend a book", intent)
+    assert all(len(chunk) == 64 for chunk in chunks[:-1])
+    assert len(sleeps) == len(chunks)
+
+
+@pytest.mark.asyncio
+async def test_openai_calls_are_concurrency_limited():
+    """Test in-flight OpenAI requests never exceed the semaphore size."""
+    in_flight = 0
+    peak = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _completion("Hello reader")
+
+    service = AIResponseService()
+    service.openai_client = _fake_client(create)
+    service._openai_sem = asyncio.Semaphore(2)
+
+    results = await asyncio.gather(
+        *(service._generate_openai_response("system", f"user {i}") for i in range(6)))
+
+    assert results == ["Hello reader"] * 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_inflight_prompts_share_one_request():
+    """Test concurrent identical prompts are coalesced into one OpenAI call."""
+    calls = 0
+
+    async def create(**kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return _completion("Hello reader")
+
+    service = AIResponseService()
+    service.openai_client = _fake_client(create)
+
+    results = await asyncio.gather(
+        *(service._generate_openai_response("system", "user") for _ in range(4)))
+
+    assert results == ["Hello reader"] * 4
+    assert calls == 1
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_completion_without_text_is_returned_unchanged():
+    """Test refusals with no message content do not break whitespace trimming."""
+    async def create(**kwargs):
+        return _completion(None)
+
+    service = AIResponseService()
+    service.openai_client = _fake_client(create)
+
+    assert await service._request_openai_completion("system", "user") is None
+
+
+@pytest.mark.asyncio
+async def test_similar_prompts_are_served_from_semantic_cache():
+    """Test near-duplicate prompts reuse the cached completion per intent."""
+    completions = []
+    vectors = {"first": [1.0, 0.0], "close": [0.99, 0.05], "far": [0.0, 1.0]}
+
+    async def create(**kwargs):
+        completions.append(kwargs)
+        return _completion(f"reply {len(completions)}")
+
+    async def embed(model, input):
+        return _embedding(vectors[input])
+
+    service = AIResponseService()
+    service.openai_client = _fake_client(create, embed)
+    semantic_cache.clear()
+
+    books = ("book_recommendation", "english", "digest")
+    discovery = ("discovery_mode", "english", "digest")
+
+    async def generate(message, partition):
+        return await service._generate_cached_openai_response(
+            "system", f"prompt for {message}", message, partition)
+
+    assert await generate("first", books) == "reply 1"
+    assert await generate("close", books) == "reply 1"
+    assert await generate("close", discovery) == "reply 2"
+    assert await generate("far", books) == "reply 3"
+    assert len(completions) == 3
+    semantic_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_never_shares_replies_across_recommendations():
+    """Test prompts differing only in their recommendations get separate replies."""
+    completions = []
+
+    async def create(**kwargs):
+        completions.append(kwargs)
+        return _completion(f"reply {len(completions)}")
+
+    async def embed(model, input):
+        return _embedding([1.0, 0.0])
+
+    service = AIResponseService()
+    service.openai_client = _fake_client(create, embed)
+    service.has_ai = True
+    semantic_cache.clear()
+    intent = {"intent": "book_recommendation", "confidence": 0.9}
+    context = {"preferred_language": "english"}
+
+    first = await service.generate_response(
+        "Any mystery books?", intent, context,
+        recommendations=[{"id": "b1", "title": "Book One", "author": "A"}])
+    second = await service.generate_response(
+        "Any mystery books?", intent, context,
+        recommendations=[{"id": "b2", "title": "Book Two", "author": "B"}])
+    repeat = await service.generate_response(
+        "Any mystery books?", intent, context,
+        recommendations=[{"id": "b1", "title": "Book One", "author": "A"}])
+
+    assert (first, second, repeat) == ("reply 1", "reply 2", "reply 1")
+    assert len(completions) == 2
+    semantic_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_history_is_sent_as_prior_chat_turns(monkeypatch):
+    """Test history follows the system prompt as separate messages."""
+    calls = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        return _completion("Try Dune")
+
+    monkeypatch.setattr(
+        "src.services.ai_response_service.settings.semantic_cache_enabled", False)
+    service = AIResponseService()
+    service.openai_client = _fake_client(create)
+    service.has_ai = True
+    history = [
+        {"sender": "user", "content": "I like sci-fi"},
+        {"sender": "noah", "content": "Great choice!"},
+    ]
+
+    response = await service.generate_response(
+        "Any picks?", {"intent": "book_recommendation"},
+        {"preferred_language": "english"}, conversation_history=history)
+
+    messages = calls[0]["messages"]
+    assert response == "Try Dune"
+    assert [m["role"] for m in messages] == ["system", "user", "assistant", "user"]
+    assert messages[0]["content"] == service._build_noah_system_prompt("english")
+    assert messages[1]["content"] == "I like sci-fi"
+    assert "RECENT CONVERSATION" not in messages[-1]["content"]
+
+
+def test_history_is_trimmed_to_token_budget(fallback_service, monkeypatch):
+    """Test the oldest history turns are dropped once the budget is exceeded."""
+    monkeypatch.setattr(
+        "src.services.ai_response_service._count_tokens", lambda text: len(text))
+    monkeypatch.setattr(
+        "src.services.ai_response_service.settings.openai_max_input_tokens", 20)
+    history = (("user", "aaaaa"), ("assistant", "bbbbb"), ("user", "ccccc"))
+
+    assert fallback_service._fit_history("sys", "prompt", history) == history[1:]
+    assert fallback_service._fit_history("sys", "x" * 30, history) == ()
+
+
+def test_system_prompt_by_language(fallback_service):
+    """Test the system prompt is selected by language with English as default."""
+    assert fallback_service._build_noah_system_prompt("japanese").startswith("あなたはノア")
+    assert fallback_service._build_noah_system_prompt("french").startswith("You are Noah")
+
+
+def test_contextual_prompt_sections(fallback_service):
+    """Test the contextual prompt includes each provided section in order."""
+    prompt = fallback_service._build_contextual_prompt(
+        user_message="Something new please",
+        intent={"intent": "discovery_mode", "confidence": 0.8,
+                "entities": {"genre": ["mystery"]}},
+        context={"current_topic": "mysteries"},
+        conversation_history=[{"sender": "user", "content": "Hi"}],
+        recommendations=[{"title": "Dune", "author": "Frank Herbert"}],
+    )
+
+    lines = prompt.split("\n")
+    assert lines[:3] == ["CURRENT CONTEXT:", "- Current topic: mysteries", ""]
+    assert "- User: Hi" in lines
+    assert "DETECTED INTENT: discovery_mode (confidence: 0.80)" in lines
+    assert "- genre: mystery" in lines
+    assert "1. Dune by Frank Herbert" in lines
+    assert lines[-3] == "USER MESSAGE: Something new please"
+    assert not prompt.endswith("\n")
+
+
+def test_contextual_prompt_is_cached_for_identical_inputs(fallback_service, monkeypatch):
+    """Test repeated prompt inputs are served from the prompt cache."""
+    renders = []
+    render = fallback_service._render_contextual_prompt
+
+    def counting_render(*args):
+        renders.append(args)
+        return render(*args)
+
+    monkeypatch.setattr(fallback_service, "_render_contextual_prompt", counting_render)
+    prompt_cache.clear()
+    intent = {"intent": "book_recommendation", "confidence": 0.9}
+
+    first = fallback_service._build_contextual_prompt("Hi", intent, {"user_mood": "calm"})
+    second = fallback_service._build_contextual_prompt("Hi", intent, {"user_mood": "calm"})
+    fallback_service._build_contextual_prompt("Hello", intent, {"user_mood": "calm"})
+
+    assert first == second
+    assert len(renders) == 2
+    prompt_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_contextual_templates_use_openai_when_available():
+    """Test template generation calls OpenAI once per distinct context."""
+    calls = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        return _completion('{"template1": "a", "template2": "b", "template3": "c"}')
+
+    service = AIResponseService()
+    service.openai_client = _fake_client(create)
+    service.preferred_provider = service._determine_preferred_provider()
+    assert service.preferred_provider == "openai"
+
+    template_cache.clear()
+    context = {"preferred_language": "english"}
+
+    for _ in range(2):
+        templates = await service.generate_contextual_response_templates(
+            "book_recommendation", context)
+        assert templates == {"template1": "a", "template2": "b", "template3": "c"}
+
+    assert len(calls) == 1
+    assert calls[0]["response_format"]["type"] == "json_schema"
+
+
+@pytest.mark.asyncio
+async def test_contextual_templates_fall_back_without_openai(fallback_service):
+    """Test template generation returns built-in templates without OpenAI."""
+    templates = await fallback_service.generate_contextual_response_templates(
+        "discovery_mode", {"preferred_language": "english"})
+
+    assert templates == fallback_service._get_fallback_templates("discovery_mode")
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_is_buffered_by_sentence():
+    """Test streamed deltas are coalesced into sentence-sized chunks."""
+    deltas = ["Hello", " there", ".", " Try", " Dune", None, "!", " It", " is", " great"]
+
+    async def stream():
+        for text in deltas:
+            yield _stream_chunk(text)
+
+    async def create(**kwargs):
+        return stream()
+
+    service = AIResponseService()
+    service.openai_client = _fake_client(create)
+
+    chunks = [
+        chunk async for chunk in
+        service._generate_openai_streaming_response("system", "user")
+    ]
+
+    assert chunks == ["Hello there.", " Try Dune!", " It is great"]
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_flushes_after_interval():
+    """Test buffered deltas are flushed when the stream stalls."""
+    async def stream():
+        for text, delay in (("Hello", 0), (" there", 0), (" reader", 0.05)):
+            await asyncio.sleep(delay)
+            yield _stream_chunk(text)
+
+    async def create(**kwargs):
+        return stream()
+
+    service = AIResponseService()
+    service.openai_client = _fake_client(create)
+
+    chunks = [
+        chunk async for chunk in
+        service._generate_openai_streaming_response("system", "user", flush_interval=0.01)
+    ]
+
+    assert chunks == ["Hello there", " reader"]
+
+
+@pytest.mark.asyncio
+async def test_openai_client_uses_pooled_http_client(monkeypatch):
+    """Test the OpenAI client shares one pooled HTTP client that aclose releases."""
+    monkeypatch.setattr(
+        "src.services.ai_response_service.settings.openai_api_key", "sk-test")
+
+    service = AIResponseService()
+    http = service._http
+
+    assert service.openai_client._client is http
+    await service.aclose()
+    assert http.is_closed
+    assert service._http is None
@@ -0,0 +1,83 @@
+"""Tests for Cognito token verification."""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+
+from src.services.auth_service import AuthService
+
+
+def _jwks():
+    """Build a JWKS holding one freshly generated RSA key."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk["kid"] = "k1"
+    return {"keys": [jwk]}
+
+
+@pytest.fixture
+def auth(monkeypatch):
+    """Create an enabled auth service whose JWKS fetches are counted."""
+    monkeypatch.setenv("COGNITO_USER_POOL_ID", "pool")
+    monkeypatch.setenv("COGNITO_CLIENT_ID", "client")
+    service = AuthService()
+    service.fetches = 0
+    jwks = _jwks()
+
+    async def get(url):
+        service.fetches += 1
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: jwks)
+
+    service._http = SimpleNamespace(get=get)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_concurrent_verifies_fetch_jwks_once(auth):
+    """Test a burst of cold-cache lookups shares a single JWKS fetch."""
+    results = await asyncio.gather(*(auth._get_jwks() for _ in range(10)))
+
+    assert auth.fetches == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_public_key_is_cached_until_jwks_refresh(auth):
+    """Test converted keys are reused and dropped when the JWKS refreshes."""
+    first = await auth._get_public_key({"kid": "k1"})
+    second = await auth._get_public_key({"kid": "k1"})
+
+    assert second is first
+    assert auth._key_cache == {"k1": first}
+
+    auth._jwks_cache_time = datetime.now(timezone.utc) - timedelta(hours=2)
+    refreshed = await auth._get_public_key({"kid": "k1"})
+
+    assert auth.fetches == 2
+    assert refreshed is not first
+    assert auth._key_cache == {"k1": refreshed}
+
+
+@pytest.mark.asyncio
+async def test_expired_token_skips_key_lookup(auth, monkeypatch):
+    """Test expired tokens are rejected before fetching a public key."""
+    async def fail(header):
+        raise AssertionError("public key should not be fetched")
+
+    monkeypatch.setattr(auth, "_get_public_key", fail)
+    token = jwt.encode({"sub": "u1", "exp": int(time.time()) - 60}, "secret",
+                       algorithm="HS256", headers={"kid": "k1"})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await auth.verify_token(token)
+
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Token has expired"
@@ -1,9 +1,11 @@
 """Tests for content processor functionality."""
 
+import asyncio
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
 
-from src.services.content_processor import ContentProcessor
+from src.services.content_processor import ContentProcessor, analysis_cache
 from src.schemas.content import ContentMetadata
 
 
@@ -189,6 +191,87 @@ class TestContentProcessorUtilities:
                 "test", "french", sample_metadata)
 
 
+class TestContentProcessorCaching:
+    """Test reuse of previous analyses."""
+
+    def test_repeat_content_is_served_from_cache(self, content_processor, sample_metadata):
+        """Test analyzing the same content twice embeds it only once."""
+        calls = []
+
+        def create(**kwargs):
+            calls.append(kwargs)
+            return SimpleNamespace(data=[SimpleNamespace(embedding=[0.5] * 1536)])
+
+        content_processor.openai_client = SimpleNamespace(
+            embeddings=SimpleNamespace(create=create))
+        analysis_cache.clear()
+        content = "これは本です。図書館で読みました。"
+
+        first = content_processor.analyze_content(content, "japanese", sample_metadata)
+        second = content_processor.analyze_content(content, "ja", sample_metadata)
+
+        assert len(calls) == 1
+        assert second == first
+        assert second is not first
+        analysis_cache.clear()
+
+    def test_batch_shares_one_embedding_request(self, content_processor, sample_metadata):
+        """Test batch analysis embeds uncached documents in a single request."""
+        calls = []
+
+        def create(**kwargs):
+            calls.append(kwargs)
+            return SimpleNamespace(data=[
+                SimpleNamespace(index=i, embedding=[float(i + 1)] * 1536)
+                for i in range(len(kwargs["input"]))
+            ])
+
+        content_processor.openai_client = SimpleNamespace(
+            embeddings=SimpleNamespace(create=create))
+        analysis_cache.clear()
+        cached = "これは本です。"
+        content_processor.analyze_content(cached, "ja", sample_metadata, embedding=[9.0])
+        calls.clear()
+
+        results = content_processor.analyze_content_batch([
+            ("一冊目。", "ja", sample_metadata),
+            (cached, "ja", sample_metadata),
+            ("二冊目。", "japanese", sample_metadata),
+        ])
+
+        assert len(calls) == 1
+        assert calls[0]["input"] == ["一冊目。", "二冊目。"]
+        assert results[0].embedding[0] == 1.0
+        assert results[1].embedding == [9.0]
+        assert results[2].embedding[0] == 2.0
+        analysis_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_many_overlaps_embedding_requests(self, content_processor, sample_metadata):
+        """Test concurrent analysis keeps several embedding requests in flight."""
+        in_flight = []
+        peak = []
+
+        async def create(**kwargs):
+            in_flight.append(kwargs["input"])
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(kwargs["input"])
+            return SimpleNamespace(data=[SimpleNamespace(embedding=[0.5] * 1536)])
+
+        content_processor.async_openai_client = SimpleNamespace(
+            embeddings=SimpleNamespace(create=create))
+        analysis_cache.clear()
+        contents = ["一冊目。", "二冊目。", "三冊目。"]
+
+        results = await content_processor.analyze_content_many(
+            [(content, "ja", sample_metadata) for content in contents])
+
+        assert max(peak) == 3
+        assert [r.embedding[0] for r in results] == [0.5, 0.5, 0.5]
+        analysis_cache.clear()
+
+
 class TestContentProcessorEdgeCases:
     """Test edge cases and error handling."""
 
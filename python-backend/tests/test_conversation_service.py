@@ -1,12 +1,13 @@
 """Tests for conversation service."""
 
-import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 from sqlalchemy.orm import Session
 
-from src.services.conversation_service import ConversationService
 from src.models.conversation import ConversationSession
+from src.services.conversation_service import ConversationService
 
 
 @pytest.fixture
@@ -177,3 +178,224 @@ def test_fallback_entity_extraction():
     result = agent_core._fallback_entity_extraction("Hello")
     assert all(len(entities) == 0 for entities in result.values()
                if entities != result["language"])
+
+
+@pytest.mark.asyncio
+async def test_agent_core_reuses_http_client(monkeypatch):
+    """Test Agent Core calls share one pooled HTTP client."""
+    import json
+
+    import httpx
+
+    from src.services.agent_core import AgentCoreService
+
+    monkeypatch.setattr(
+        "src.services.agent_core.settings.agent_core_api_key", "test-key")
+
+    requests = []
+
+    def handler(request):
+        assert json.loads(request.content)["message"] == "Recommend a book"
+        requests.append(
+            (request.url.path, request.headers["Authorization"]))
+        return httpx.Response(200, json={"intent": "book_recommendation"})
+
+    async with AgentCoreService() as agent_core:
+        agent_core.enhanced_intent_service = None
+        agent_core._client = httpx.AsyncClient(
+            base_url="http://agent-core",
+            headers=agent_core._headers,
+            transport=httpx.MockTransport(handler))
+        client = agent_core._client
+
+        for _ in range(3):
+            result = await agent_core.analyze_intent("Recommend a book")
+            assert result["intent"] == "book_recommendation"
+
+        assert agent_core._client is client
+
+    assert requests == [("/analyze-intent", "Bearer test-key")] * 3
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_agent_core_analyze_runs_lookups_concurrently():
+    """Test analyze combines intent and entity lookups and tolerates failures."""
+    from src.services.agent_core import AgentCoreService
+
+    async with AgentCoreService() as agent_core:
+        agent_core.analyze_intent = AsyncMock(side_effect=RuntimeError("down"))
+        agent_core.extract_entities = AsyncMock(
+            return_value={"language": ["japanese"]})
+
+        intent, entities = await agent_core.analyze("Recommend a Japanese book")
+
+    assert intent["intent"] == "book_recommendation"
+    assert entities == {"language": ["japanese"]}
+
+
+def test_fallback_intent_analysis_matches_trigger_substrings():
+    """Test fallback intent triggers match inflected words as substrings."""
+    from src.services.agent_core import AgentCoreService
+
+    agent_core = AgentCoreService()
+
+    result = agent_core._fallback_intent_analysis("suggested reads?")
+    assert result["intent"] == "book_recommendation"
+
+    result = agent_core._fallback_intent_analysis("she likes thrillers")
+    assert result["intent"] == "feedback"
+
+    result = agent_core._fallback_intent_analysis("recommends")
+    assert result["intent"] == "book_recommendation"
+
+    result = agent_core._fallback_intent_analysis("Any good books?")
+    assert result["intent"] == "book_recommendation"
+
+    result = agent_core._fallback_intent_analysis("That one is not for me")
+    assert result["intent"] == "feedback"
+
+    # Higher-priority triggers win even when they overlap a lower one
+    result = agent_core._fallback_intent_analysis("newhere can i")
+    assert result["intent"] == "purchase_inquiry"
+
+
+def test_fallback_analysis_is_cached_per_message():
+    """Test repeated fallback lookups hit the cache and return fresh dicts."""
+    from src.services.agent_core import AgentCoreService, _classify_fallback_intent
+
+    agent_core = AgentCoreService()
+    _classify_fallback_intent.cache_clear()
+
+    first = agent_core._fallback_intent_analysis("Recommend a book")
+    first["entities"]["genre"] = ["mystery"]
+    second = agent_core._fallback_intent_analysis("RECOMMEND A BOOK")
+
+    assert second == {
+        "intent": "book_recommendation", "confidence": 0.7, "entities": {}}
+    assert _classify_fallback_intent.cache_info().hits == 1
+
+    entities = agent_core._fallback_entity_extraction("Japanese or English?")
+    entities["language"].append("french")
+    assert agent_core._fallback_entity_extraction(
+        "Japanese or English?")["language"] == ["japanese", "english"]
+
+
+@pytest.mark.asyncio
+async def test_update_context_fallback_timestamp_is_utc():
+    """Test the fallback context update stamps a timezone-aware UTC time."""
+    from datetime import datetime, timezone
+
+    from src.services.agent_core import AgentCoreService
+
+    async with AgentCoreService() as agent_core:
+        agent_core._client.post = AsyncMock(side_effect=RuntimeError("down"))
+
+        result = await agent_core.update_conversation_context(
+            "session_1", "hi", "hello", {"intent": "general_conversation"})
+
+    last_update = datetime.fromisoformat(result["updated_context"]["last_update"])
+    assert last_update.tzinfo == timezone.utc
+    assert last_update.microsecond == 0
+
+
+@pytest.mark.asyncio
+async def test_context_updates_are_sent_in_background():
+    """Test queued context updates are delivered and flushed on close."""
+    from src.services.agent_core import AgentCoreService
+
+    # Leaving the context closes the service, which flushes the queue
+    async with AgentCoreService() as agent_core:
+        agent_core.update_conversation_context = AsyncMock(return_value={})
+
+        for i in range(3):
+            agent_core.enqueue_context_update(
+                f"session_{i}", "hi", "hello", {"intent": "general_conversation"})
+
+    assert agent_core.update_conversation_context.await_count == 3
+    agent_core.update_conversation_context.assert_awaited_with(
+        "session_2", "hi", "hello", {"intent": "general_conversation"})
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_skips_failing_endpoint(monkeypatch):
+    """Test repeated Agent Core failures open the breaker until cooldown."""
+    import httpx
+
+    from src.services.agent_core import AgentCoreService
+
+    now = [1000.0]
+    monkeypatch.setattr("src.services.agent_core.time.monotonic", lambda: now[0])
+
+    async with AgentCoreService() as agent_core:
+        agent_core.enhanced_intent_service = None
+        agent_core._client.post = AsyncMock(side_effect=httpx.ConnectError("down"))
+
+        for _ in range(8):
+            result = await agent_core.analyze_intent("Recommend a book")
+            assert result["intent"] == "book_recommendation"
+
+        assert agent_core._client.post.await_count == agent_core._breaker.fail_threshold
+        assert agent_core._breaker.is_open
+
+        # After the cooldown a probe goes through and closes the breaker
+        now[0] += agent_core._breaker.reset_seconds
+        agent_core._client.post = AsyncMock(return_value=httpx.Response(
+            200, json={"intent": "discovery_mode"},
+            request=httpx.Request("POST", "http://agent-core/analyze-intent")))
+
+        result = await agent_core.analyze_intent("Recommend a book")
+        assert result["intent"] == "discovery_mode"
+        assert not agent_core._breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_ignores_client_errors():
+    """Test 4xx replies fall back without opening the breaker."""
+    import httpx
+
+    from src.services.agent_core import AgentCoreService
+
+    async with AgentCoreService() as agent_core:
+        agent_core.enhanced_intent_service = None
+        agent_core._client.post = AsyncMock(return_value=httpx.Response(
+            401, request=httpx.Request("POST", "http://agent-core/analyze-intent")))
+
+        for _ in range(8):
+            result = await agent_core.analyze_intent("Recommend a book")
+            assert result["intent"] == "book_recommendation"
+
+        assert agent_core._client.post.await_count == 8
+        assert not agent_core._breaker.is_open
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_half_open_allows_one_probe(monkeypatch):
+    """Test only one call probes after the cooldown while the rest fall back."""
+    import httpx
+
+    from src.services.agent_core import AgentCoreService
+
+    now = [1000.0]
+    monkeypatch.setattr("src.services.agent_core.time.monotonic", lambda: now[0])
+
+    async def slow_post(path, content):
+        # Yield without a timer; the patched clock also drives the event loop
+        await asyncio.sleep(0)
+        return httpx.Response(
+            503, request=httpx.Request("POST", "http://agent-core" + path))
+
+    async with AgentCoreService() as agent_core:
+        agent_core.enhanced_intent_service = None
+        for _ in range(agent_core._breaker.fail_threshold):
+            agent_core._breaker.record_failure()
+        now[0] += agent_core._breaker.reset_seconds
+        agent_core._client.post = AsyncMock(side_effect=slow_post)
+
+        results = await asyncio.gather(
+            *(agent_core.analyze_intent("Recommend a book") for _ in range(5)))
+
+        assert [r["intent"] for r in results] == ["book_recommendation"] * 5
+        assert agent_core._client.post.await_count == 1
+        # The failed probe reopens the breaker for another cooldown
+        assert agent_core._breaker.is_open
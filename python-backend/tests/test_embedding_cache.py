@@ -0,0 +1,36 @@
+"""Tests for the persistent embedding cache."""
+
+import threading
+
+from src.services.embedding_cache import EmbeddingCache
+
+
+def test_embeddings_round_trip_as_float32(tmp_path):
+    """Test stored vectors come back from disk in a new cache instance."""
+    path = str(tmp_path / "emb.db")
+    key = EmbeddingCache.key("model", "text")
+    EmbeddingCache(path).set(key, [0.5, -0.25, 1.0])
+
+    assert EmbeddingCache(path).get(key) == [0.5, -0.25, 1.0]
+    assert EmbeddingCache(path).get(EmbeddingCache.key("other", "text")) is None
+
+
+def test_empty_path_disables_cache():
+    """Test an unconfigured cache never stores anything."""
+    cache = EmbeddingCache("")
+    key = EmbeddingCache.key("model", "text")
+    cache.set(key, [1.0])
+
+    assert cache.get(key) is None
+
+
+def test_each_thread_uses_its_own_connection(tmp_path):
+    """Test writes from another thread are visible to readers."""
+    cache = EmbeddingCache(str(tmp_path / "emb.db"))
+    key = EmbeddingCache.key("model", "text")
+
+    worker = threading.Thread(target=cache.set, args=(key, [2.0]))
+    worker.start()
+    worker.join()
+
+    assert cache.get(key) == [2.0]
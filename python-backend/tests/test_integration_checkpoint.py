@@ -90,16 +90,18 @@ class TestCoreSystemsIntegration:
         """Test conversation service integrating with content processing."""
 
         # Mock agent core responses
-        conversation_service.agent_core.analyze_intent.return_value = {
-            "intent": "book_recommendation",
-            "confidence": 0.9
-        }
-        conversation_service.agent_core.extract_entities.return_value = {
-            "book_title": [],
-            "author": [],
-            "genre": ["computer science"],
-            "language": ["english"]
-        }
+        conversation_service.agent_core.analyze.return_value = (
+            {
+                "intent": "book_recommendation",
+                "confidence": 0.9
+            },
+            {
+                "book_title": [],
+                "author": [],
+                "genre": ["computer science"],
+                "language": ["english"]
+            }
+        )
         conversation_service.agent_core.generate_response.return_value = (
             "Based on your interest in computer science, here are some recommendations:"
         )
@@ -276,14 +278,14 @@ class TestCoreSystemsIntegration:
         """Test complete conversation flow with basic recommendation requests."""
 
         # Mock agent core for different conversation types
-        conversation_service.agent_core.analyze_intent.side_effect = [
-            {"intent": "book_recommendation", "confidence": 0.9},
-            {"intent": "discovery_mode", "confidence": 0.8},
-            {"intent": "purchase_inquiry", "confidence": 0.7}
-        ]
-        conversation_service.agent_core.extract_entities.return_value = {
+        entities = {
             "book_title": [], "author": [], "genre": [], "language": ["english"]
         }
+        conversation_service.agent_core.analyze.side_effect = [
+            ({"intent": "book_recommendation", "confidence": 0.9}, entities),
+            ({"intent": "discovery_mode", "confidence": 0.8}, entities),
+            ({"intent": "purchase_inquiry", "confidence": 0.7}, entities)
+        ]
         conversation_service.agent_core.generate_response.side_effect = [
             "Here are some great book recommendations for you!",
             "I'm feeling adventurous! Here's something different:",
@@ -333,7 +335,7 @@ class TestCoreSystemsIntegration:
         """Test error handling across integrated systems."""
 
         # Test conversation service error handling
-        conversation_service.agent_core.analyze_intent.side_effect = Exception(
+        conversation_service.agent_core.analyze.side_effect = Exception(
             "NLU service unavailable")
 
         mock_db.query.return_value.filter.return_value.first.return_value = None
@@ -422,10 +424,8 @@ class TestCoreSystemsIntegration:
             x, 'session_id', mock_session.session_id))
 
         # Mock agent core
-        conversation_service.agent_core.analyze_intent.return_value = {
-            "intent": "general_conversation"}
-        conversation_service.agent_core.extract_entities.return_value = {
-            "language": ["english"]}
+        conversation_service.agent_core.analyze.return_value = (
+            {"intent": "general_conversation"}, {"language": ["english"]})
         conversation_service.agent_core.generate_response.return_value = "Hello! How can I help you?"
 
         session_id = "session_testuser_123456"
@@ -244,6 +244,41 @@ def test_pydantic_schema_validation():
     assert content_create.metadata.author == "Schema Author"
 
 
+def test_search_results_adapter_from_orm(db_session):
+    """Test search results validate directly from ORM content items."""
+    from src.schemas.content import SearchResultsAdapter
+
+    now = datetime.utcnow()
+    content = ContentItem(
+        id="content_search_test",
+        title="Search Test",
+        content="Searchable content",
+        language="english",
+        content_metadata={
+            "author": "Search Author",
+            "source": "test",
+            "publish_date": now.isoformat(),
+            "content_type": "article",
+            "estimated_reading_time": 5,
+            "tags": []
+        },
+        analysis=None,
+        created_at=now,
+        updated_at=now
+    )
+    db_session.add(content)
+    db_session.commit()
+
+    results = SearchResultsAdapter.validate_python(
+        [{"content": content, "similarity_score": 0.9, "match_metadata": {}}],
+        from_attributes=True
+    )
+
+    assert results[0].content.id == "content_search_test"
+    assert results[0].content.metadata.author == "Search Author"
+    assert results[0].similarity_score == 0.9
+
+
 def test_discovery_models(db_session):
     """Test DiscoveryRecommendation model."""
     # Create content and user profile
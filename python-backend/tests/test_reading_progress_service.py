@@ -177,6 +177,43 @@ class TestReadingProgressTracker:
         assert metrics["current_reading_speed"] == 150.0  # 150 WPM
         assert metrics["engagement_metrics"]["scroll_events"] == 3
 
+    def test_behavioral_metrics_update_does_not_mutate_behavior(self, tracker):
+        """Test metrics are built on copies of the loaded event lists."""
+        behavior = ReadingBehavior(pause_patterns=[], interactions=[])
+
+        tracker._update_behavioral_metrics(
+            behavior, {"pause_event": {"type": "thinking", "duration": 5}}
+        )
+
+        assert behavior.pause_patterns == []
+
+    def test_persist_progress_update(self, tracker, db_session):
+        """Test progress events are appended in a single update."""
+        behavior = ReadingBehavior(
+            content_id="test_content",
+            user_id="test_user",
+            session_id="session_persist",
+            start_time=datetime.utcnow(),
+            pause_patterns=[{"type": "initial"}],
+            interactions=[]
+        )
+        db_session.add(behavior)
+        db_session.commit()
+
+        progress_data = {
+            "pause_event": {"type": "thinking", "duration": 5},
+            "completion_rate": 0.4
+        }
+        metrics = tracker._update_behavioral_metrics(behavior, progress_data)
+        tracker._persist_progress_update(
+            behavior, progress_data, metrics, db_session)
+
+        db_session.refresh(behavior)
+        assert [p["type"] for p in behavior.pause_patterns] == [
+            "initial", "thinking"]
+        assert behavior.interactions == []
+        assert behavior.completion_rate == 0.4
+
     def test_performance_indicators_calculation(self, tracker):
         """Test calculation of performance indicators."""
         metrics = {
@@ -501,3 +501,17 @@ async def test_mood_based_scoring(db_session: Session, sample_user_profile, samp
     for rec in focused_recs:
         assert "mood_factors" in rec.get(
             "contextual_factors", {}) or "mood_based" in rec.get("score_breakdown", {})
+
+
+def test_batch_interest_scores(sample_user_profile, sample_content_items):
+    """Test vectorized interest scores match the per-topic mean."""
+    preferences = PreferenceModel(**sample_user_profile.preferences)
+    no_topics = ContentItem(id="no_topics", analysis={"topics": []})
+
+    scores = contextual_recommendation_engine._batch_interest_scores(
+        [sample_content_items[0], no_topics], preferences
+    )
+
+    # technology: 0.8 * 0.9, programming: 0.0 * 0.8
+    assert scores[0] == pytest.approx((0.8 * 0.9 + 0.0) / 2)
+    assert scores[1] == 0.0
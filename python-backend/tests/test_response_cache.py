@@ -0,0 +1,53 @@
+"""Tests for in-process response caches."""
+
+from src.models.user_profile import UserProfile
+from src.services.response_cache import ResponseCache, user_profile_response_cache
+
+
+def test_get_returns_stored_payload():
+    """Test stored payloads are returned until invalidated."""
+    cache = ResponseCache(maxsize=10, ttl_seconds=60)
+    cache.set("a", b"{}")
+
+    assert cache.get("a") == b"{}"
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+
+def test_expired_entries_are_dropped(monkeypatch):
+    """Test entries are not served past their TTL."""
+    now = [1000.0]
+    monkeypatch.setattr(
+        "src.services.response_cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache(maxsize=10, ttl_seconds=5)
+    cache.set("a", b"{}")
+
+    now[0] += 6
+    assert cache.get("a") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test the cache stays within maxsize."""
+    cache = ResponseCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert cache.get("a") == b"1"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"3"
+
+
+def test_profile_update_invalidates_cache(db_session):
+    """Test ORM updates to a profile drop its cached response."""
+    profile = UserProfile(user_id="cached_user", preferences={}, reading_levels={})
+    db_session.add(profile)
+    db_session.commit()
+
+    user_profile_response_cache.set("cached_user", b"{}")
+    profile.reading_levels = {"english": {"level": 9.0}}
+    db_session.commit()
+
+    assert user_profile_response_cache.get("cached_user") is None
@@ -0,0 +1,53 @@
+"""Tests for the embedding-based response cache."""
+
+import numpy as np
+
+from src.services.semantic_cache import SemanticResponseCache
+
+
+def test_lookup_only_matches_within_partition():
+    """Test a near-identical prompt in another partition is a miss."""
+    cache = SemanticResponseCache(capacity=4)
+    embedding = cache.normalize([1.0, 0.0])
+    cache.add(embedding, "a", "reply")
+
+    assert cache.lookup(embedding, "a") == "reply"
+    assert cache.lookup(embedding, "b") is None
+
+
+def test_evicted_partitions_leave_the_index():
+    """Test the partition index stays bounded by capacity as entries are evicted."""
+    cache = SemanticResponseCache(capacity=4)
+    embedding = cache.normalize(np.ones(8))
+
+    for i in range(1000):
+        cache.add(embedding, ("intent", "english", str(i)), f"reply {i}")
+
+    assert len(cache) == 4
+    assert len(cache._key_index) == 4
+    assert cache.lookup(embedding, ("intent", "english", "999")) == "reply 999"
+    assert cache.lookup(embedding, ("intent", "english", "0")) is None
+
+
+def test_shared_partition_survives_partial_eviction():
+    """Test a partition stays matchable while any of its entries remain."""
+    cache = SemanticResponseCache(capacity=2)
+    first = cache.normalize([1.0, 0.0])
+    second = cache.normalize([0.0, 1.0])
+    cache.add(first, "shared", "first")
+    cache.add(second, "shared", "second")
+    cache.add(first, "other", "third")
+
+    assert cache.lookup(second, "shared") == "second"
+    assert set(cache._key_index) == {"shared", "other"}
+
+
+def test_clear_resets_partition_index():
+    """Test clearing the cache forgets every partition."""
+    cache = SemanticResponseCache(capacity=4)
+    cache.add(cache.normalize([1.0, 0.0]), "a", "reply")
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache._key_index == {}
+    assert cache._tick == 0